@@ -23,3 +23,10 @@ def test_derive(ashtadhyayi):
     la = Vibhakti('la~w').add_samjna('prathama', 'ekavacana')
     items = [dhatu, la]
     assert 'Bavati' in ashtadhyayi.derive(items)
+
+
+def test_derive_unique(ashtadhyayi):
+    dhatu = Upadesha.as_dhatu('BU')
+    la = Vibhakti('la~w').add_samjna('prathama', 'ekavacana')
+    results = list(ashtadhyayi.derive([dhatu, la]))
+    assert len(results) == len(set(results))
@@ -9,6 +9,7 @@
 """
 
 from vyakarana.derivations import State
+from vyakarana.terms import Upadesha
 
 
 class TestState(object):
@@ -23,3 +24,22 @@ class TestState(object):
         s = State(items)
         assert s.terms == items
         assert s.history == []
+
+    def test_hash(self):
+        s = State(list('abc'))
+        assert hash(s) == hash(State(list('abc')))
+        assert {s: 1}[State(list('abc'))] == 1
+
+    def test_swap_shares_history(self):
+        s = State(list('abc'), [('rule', 0)])
+        t = s.swap(1, 'x')
+        assert t.terms == list('axc')
+        assert s.terms == list('abc')
+        assert t.history is s.history
+
+    def test_mark_rule_extends_history(self):
+        s = State([Upadesha('a')], [('rule', 0)])
+        t = s.mark_rule('other', 0)
+        assert t.history == [('rule', 0), ('other', 0)]
+        assert s.history == [('rule', 0)]
+        assert 'other' in t[0].ops
@@ -30,3 +30,11 @@ def test_dhatu_list():
     for start, end, expected_len in cases:
         results = d.dhatu_list(start, end)
         assert len(results) == expected_len
+
+
+def test_dhatu_list_cached():
+    d = D.Dhatupatha(D.DHATUPATHA_CSV)
+    first = d.dhatu_list('ya\\ja~^')
+    first.append('extra')
+    assert len(d.dhatu_list('ya\\ja~^')) == 9
+    assert d.dhatu_set('ya\\ja~^') is d.dhatu_set('ya\\ja~^')
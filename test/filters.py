@@ -239,6 +239,53 @@ def test_or_():
            term_tester)
 
 
+def test_or_samjna():
+    f = F.samjna('kit') | F.samjna('Rit') | F.raw('tip')
+    for raw in ['kta', 'Ric', 'tip']:
+        assert f.allows([Pratyaya(raw)], 0) is True
+    for raw in ['Sap', 'tas']:
+        assert f.allows([Pratyaya(raw)], 0) is False
+
+
+def test_and_samjna():
+    f = F.samjna('pratyaya') & F.raw('kta')
+    assert f.allows([Pratyaya('kta')], 0) is True
+    assert f.allows([Pratyaya('tip')], 0) is False
+
+    f = F.samjna('dhatu') & F.raw('kta')
+    assert f.allows([Pratyaya('kta')], 0) is False
+
+
+def test_and_or_not_mixed():
+    """Combine a state filter with a term filter."""
+    def is_first(state, index):
+        return index == 0
+
+    first = F.Filter.no_params(is_first)
+    hal = F.al('hal')
+    state = [Upadesha('a~').set_value(x) for x in ['lih', 'agni', 'dfS']]
+
+    assert type(first & hal) is F.Filter
+    assert [(first & hal).allows(state, i) for i in range(3)] == \
+        [True, False, False]
+    assert [(first | hal).allows(state, i) for i in range(3)] == \
+        [True, False, True]
+    assert [(~first).allows(state, i) for i in range(3)] == \
+        [False, True, True]
+
+
+def test_and_cheapest_first():
+    calls = []
+
+    def expensive(term):
+        calls.append(term)
+        return True
+
+    f = F.TermFilter.no_params(expensive) & F.raw('Yam')
+    assert not f.allows([Upadesha('a~')], 0)
+    assert calls == []
+
+
 def test_not_():
     cases = [
         (['al'],
@@ -281,6 +328,12 @@ def test_equality():
             assert function(item) == function(item)
 
 
+def test_declarations_cached():
+    assert F.samjna('kit', 'Nit') is F.samjna('kit', 'Nit')
+    assert F.samjna('kit') is not F.lakshana('kit')
+    assert F.Filter(name='x', body='x') is not F.Filter(name='x', body='x')
+
+
 # 'auto' filter
 # ~~~~~~~~~~~~~
 
@@ -306,6 +359,11 @@ def test_auto_on_dhatu():
         assert F.auto(item) == F.dhatu(item)
 
 
+def test_auto_cached():
+    assert F.auto('kit', 'Nit') is F.auto('kit', 'Nit')
+    assert F.auto(None) is F.allow_all
+
+
 # Filter relationships
 # ~~~~~~~~~~~~~~~~~~~~
 
@@ -84,6 +84,14 @@ def verify(cases, operator):
         assert operator.apply(state, 0)[0].value == expected
 
 
+def test_conflicts_with():
+    assert O.dirgha.conflicts_with(O.hrasva)
+    assert O.ti('a').conflicts_with(O.tasya('a'))
+    assert O.insert('a').conflicts_with(O.insert('b'))
+    assert not O.guna.conflicts_with(O.hrasva)
+    assert not O.guna.conflicts_with(O.guna)
+
+
 def test_dirgha():
     cases = [
         ('kram', 'krAm'),
@@ -119,6 +127,8 @@ def test_samprasarana():
         ('jyA', 'ji'),
         ('vyaD', 'viD'),
         ('Brasj', 'Bfsj'),
+        # A final yaN has no following vowel to elide.
+        ('ay', 'ai'),
     ]
     verify(cases, O.samprasarana)
 
@@ -132,3 +142,17 @@ def test_vrddhi():
         ('sad', 'sad'),  # iko guNavRddhI
     ]
     verify(cases, O.vrddhi)
+
+
+def test_tasya():
+    cases = [
+        (O.tasya('A'), 'ti', 'tA'),
+        (O.tasya('Ana'), 'ti', 'Ana'),
+        (O.tasya(Upadesha('vu~k')), 'BU', 'BUv'),
+        (O.tasya(Upadesha('iw')), 'sya', 'isya'),
+        (O.tasya(Upadesha('nu~m')), 'ruD', 'runD'),
+        (O.tasya(Upadesha('iya~N')), 'BrI', 'Briy'),
+        (O.adi('s'), 'zah', 'sah'),
+    ]
+    for operator, original, expected in cases:
+        verify([(original, expected)], operator)
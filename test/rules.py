@@ -1,3 +1,4 @@
+from vyakarana import filters as F
 from vyakarana.rules import *
 
 
@@ -26,3 +27,11 @@ def test_new_tasya():
     pass
 
 
+def test_features():
+    dhatu, tip = F.samjna('dhatu'), F.raw('tip')
+    r = Rule('name', [[dhatu, tip]], 'operator')
+    features = r.features()
+    assert isinstance(features, frozenset)
+    assert (dhatu, 0) in features
+    assert (tip, 1) in features
+    assert r.features() is features
@@ -32,6 +32,7 @@ class TestSound(object):
         for L in 'aAiIuUfF':
             v = Sound(L)
             assert v.savarna_set == set(L.lower() + L.upper())
+            assert v.savarna_set is v.savarna_set
             assert v.savarna(L.lower())
             assert v.savarna(L.upper())
 
@@ -49,6 +50,7 @@ class TestSoundCollection(object):
             s = cls('ac')
             assert s.name
             assert s.values
+            assert isinstance(s.values, frozenset)
 
     def test_contains(self):
         s = Sounds('pu')
@@ -11,6 +11,7 @@
 import pytest
 
 from vyakarana import expand, trees
+from vyakarana import filters as F
 
 
 def apavada():
@@ -81,3 +82,11 @@ def apavada():
 @pytest.mark.parametrize(('rule', 'expected', 'observed'), apavada())
 def test_apavada(rule, expected, observed):
     assert expected == observed
+
+
+def test_feature_priority():
+    raw = (F.raw('BU'), 0)
+    samjna = (F.samjna('dhatu'), 0)
+    other = (F.al('ac'), 0)
+    features = [other, samjna, raw]
+    assert sorted(features, key=trees.feature_priority) == [raw, samjna, other]
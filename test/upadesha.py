@@ -12,6 +12,10 @@ import pytest
 
 from vyakarana.terms import *
 
+AC = Sounds('ac')
+HAL = Sounds('hal')
+TU_S_M = Sounds('tu s m')
+
 
 class TestDataSpace(object):
 
@@ -30,6 +34,13 @@ class TestDataSpace(object):
         d2 = self.d.replace(value='B')
         assert d2 == ('A', 'A', 'B', 'B', 'B')
 
+    def test_set(self):
+        assert self.d.set_raw('B', 'C') == ('B', 'C', 'C', 'C', 'C')
+        assert self.d.set_value('B') == self.d.replace(value='B')
+        assert self.d.set_asiddhavat('B') == self.d.replace(asiddhavat='B')
+        assert self.d.set_asiddha('') == self.d.replace(asiddha='')
+        assert isinstance(self.d.set_value('B'), DataSpace)
+
     def test_replace_blank(self):
         d2 = self.d.replace(asiddha='')
         assert d2 == ('A', 'A', 'A', 'A', '')
@@ -53,6 +64,12 @@ def test_init():
     assert not u.parts
 
 
+def test_init_frozen():
+    u = Pratyaya('Sap').set_raw('tip').add_samjna('anga')
+    for attr in [u.samjna, u.lakshana, u.parts, u.ops]:
+        assert isinstance(attr, frozenset)
+
+
 def test_init_no_raw():
     u = Upadesha(data='data', samjna='samjna', lakshana='lakshana',
                  ops='ops', parts='parts')
@@ -163,6 +180,18 @@ def test_ne(eq_upadeshas):
     assert u1 != u7
 
 
+def test_hash():
+    u1 = Upadesha('vu~k')
+    u2 = Upadesha('vu~k')
+    assert hash(u1) == hash(u2)
+    assert hash(u1) == hash(u1)
+    assert len(set([u1, u2, Upadesha('a')])) == 2
+
+    # The hash reflects a value set by a subclass constructor.
+    p = Pratyaya('lu~k')
+    assert hash(p) == hash(p.value)
+
+
 def test_upadesha_dataspace():
     dhatu = Upadesha('Pala~')
     assert dhatu.data == ('Pala~', 'Pal', 'Pal', 'Pal', 'Pal')
@@ -179,8 +208,8 @@ def test_upadesha_dataspace():
 
 def test_parse_it():
     # 1.3.2
-    for v in Sounds('ac'):
-        for c in Sounds('hal'):
+    for v in AC:
+        for c in HAL:
             if c + v in ('Yi', 'wu', 'qu'):
                 continue
             s = c + v + '~'
@@ -190,8 +219,8 @@ def test_parse_it():
             assert v + 'dit' in u.samjna
 
     # 1.3.3
-    for v in Sounds('ac'):
-        for c in Sounds('hal'):
+    for v in AC:
+        for c in HAL:
             s = v + c
             u = Upadesha(s)
             assert u.raw == s
@@ -199,8 +228,8 @@ def test_parse_it():
             assert c + 'it' in u.samjna
 
     # 1.3.4
-    for v in Sounds('ac'):
-        for c in Sounds('tu s m'):
+    for v in AC:
+        for c in TU_S_M:
             s = v + c
             u = Upadesha(s, vibhakti=True)
             assert u.raw == s
@@ -218,6 +247,25 @@ def test_parse_it():
         assert u.value == value
 
 
+def test_parse_it_cached():
+    a = Upadesha('vu~k')
+    b = Upadesha('vu~k')
+    assert a.samjna is b.samjna
+
+    # The cache respects the flags that change how 'it' is parsed.
+    assert Upadesha('am').value == 'a'
+    assert Upadesha('am', vibhakti=True).value == 'am'
+    assert Upadesha('am').value == 'a'
+
+
+def test_samjna_interned():
+    tip = Pratyaya('tip')
+    sip = Pratyaya('sip')
+    assert tip.samjna == set(['pit', 'pratyaya'])
+    assert tip.samjna is sip.samjna
+    assert tip.add_samjna('x').samjna is sip.add_samjna('x').samjna
+
+
 def test_anga():
     a = Upadesha.as_anga('nara')
     assert 'anga' in a.samjna
@@ -284,3 +332,31 @@ def test_vibhakti():
 
         for it in its:
             assert it in v.samjna
+
+
+def test_signature():
+    u = Upadesha.as_dhatu('BU')
+    assert u.signature == u.add_op('rule').signature
+    assert u.signature != u.add_samjna('abhyasta').signature
+    assert u.signature != u.set_value('Bo').signature
+
+
+def test_copy_interned():
+    u = Upadesha.as_dhatu('BU')
+    a = u.add_op('rule')
+    assert a is u.add_op('rule')
+    assert a is not u.add_op('other')
+
+
+def test_add_op_shares_filter_cache():
+    u = Upadesha.as_dhatu('BU')
+    u._filter_cache['f'] = True
+    assert u.add_op('rule')._filter_cache is u._filter_cache
+    assert u.add_samjna('foo')._filter_cache is not u._filter_cache
+
+
+def test_samjna_mask():
+    u = Upadesha.as_dhatu('BU')
+    assert u.samjna_mask == samjna_mask(u.samjna)
+    assert u.samjna_mask & samjna_mask(['dhatu', 'foo'])
+    assert not u.samjna_mask & samjna_mask(['pratyaya'])
@@ -19,6 +19,8 @@ def test_iter_group():
     items = list(range(18))
     groups = [list(range(6)), list(range(6, 12)), list(range(12, 18))]
     assert list(iter_group(items, 6)) == groups
+    assert list(iter_group(iter(items), 6)) == groups
+    assert list(iter_group(iter(items), 5))[-1] == [15, 16, 17]
 
 
 def test_iter_pairwise():
@@ -57,3 +59,32 @@ def test_sound_editor_prev_next(editor_data):
             assert prev.value == data[i - 1]
         if i < len(data) - 1:
             assert next.value == data[i + 1]
+
+
+def test_sound_editor_join(editor_data):
+    data, terms, state, editor = editor_data
+    for index in editor:
+        if index.value in 'aeiou':
+            index.value = index.value.upper()
+    new_state = editor.join()
+    assert [t.asiddha for t in new_state] == [
+        'AbcdEf', 'ghIjkl', 'mnOpqr', 'stUvxw', 'yz1234', '567890']
+
+
+def test_sound_editor_sentinel(editor_data):
+    data, terms, state, editor = editor_data
+    indices = list(editor)
+    first, last = indices[0], indices[-1]
+    assert first.prev.value is None
+    assert last.next.value is None
+    assert first.prev is last.next
+    assert first.next is indices[1]
+
+
+def test_sound_index_first_last(editor_data):
+    data, terms, state, editor = editor_data
+    for i, index in enumerate(editor):
+        assert index.first == (i % 6 == 0)
+        assert index.last == (i % 6 == 5)
+    assert not editor.sentinel.first
+    assert not editor.sentinel.last
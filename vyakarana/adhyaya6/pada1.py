@@ -16,6 +16,8 @@ from ..terms import Upadesha
 
 f = F.auto
 
+ec = Sounds('ec')
+
 #: 6.1.15
 VACI_SVAPI = f(*['va\\ca~', 'Yizva\\pa~'] + DP.dhatu_list('ya\\ja~^'))
 
@@ -56,7 +58,7 @@ def na_adesha(value):
 @F.TermFilter.no_params
 def ec_upadesha(term):
     clean = term.clean
-    return clean and clean[-1] in Sounds('ec')
+    return clean and clean[-1] in ec
 
 
 RULES = [
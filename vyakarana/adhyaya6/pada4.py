@@ -25,11 +25,14 @@ from ..terms import Upadesha as U
 
 f = F.auto
 
+ac = Sounds('ac')
+hal = Sounds('hal')
+jhaz = Sounds('Jaz')
+nasal = Sounds('Yam')
+
 
 @O.DataOperator.no_params
 def shnam_lopa(value):
-    ac = Sounds('ac')
-    nasal = Sounds('Yam')
     letters = list(reversed(value))
     for i, L in enumerate(letters):
         if L in ac:
@@ -45,16 +48,18 @@ def bhrasjo_ram(value, **kw):
     return 'Barj'
 
 
+IYAN = O.tasya(U('iya~N'))
+UVAN = O.tasya(U('uva~N'))
+ED_ADESHA = O.replace('a', 'e')
+
+
 @O.Operator.no_params
 def iyan_uvan(state, index, locus):
-    iyan = O.tasya(U('iya~N'))
-    uvan = O.tasya(U('uva~N'))
-
     cur = state[index]
     if cur.antya in 'iI':
-        return iyan.apply(state, index, locus)
+        return IYAN.apply(state, index, locus)
     else:
-        return uvan.apply(state, index, locus)
+        return UVAN.apply(state, index, locus)
 
 
 iyan_uvan.category = 'tasya'
@@ -84,7 +89,6 @@ def at_ekahalmadhya_anadeshadi(state, index):
         abhyasa = state[index - 1]
         anga = state[index]
         a, b, c = anga.value
-        hal = Sounds('hal')
         # Anga has the pattern CVC, where C is a consonant and V
         # is a vowel.
         eka_hal_madhya = a in hal and b == 'a' and c in hal
@@ -92,7 +96,7 @@ def at_ekahalmadhya_anadeshadi(state, index):
         # sure how to account for 8.4.54 in the normal way, so as
         # a hack, I check for the consonants that 8.4.54 would
         # modify.
-        _8_4_54 = anga.adi not in Sounds('Jaz')
+        _8_4_54 = anga.adi not in jhaz
         anadeshadi = abhyasa.adi == anga.adi and _8_4_54
 
         return eka_hal_madhya and anadeshadi
@@ -103,10 +107,9 @@ def at_ekahalmadhya_anadeshadi(state, index):
 @O.Operator.no_params
 def et_abhyasa_lopa(state, i, locus):
     abhyasa = state[i - 1].set_asiddhavat('')
-    ed_adesha = O.replace('a', 'e')
 
     abhyasta = state[i]
-    abhyasta_value = ed_adesha.body(abhyasta.value)
+    abhyasta_value = ED_ADESHA.body(abhyasta.value)
     abhyasta = abhyasta.set_asiddhavat(abhyasta_value)
     return state.swap(i - 1, abhyasa).swap(i, abhyasta)
 
@@ -22,12 +22,13 @@ _78_stems = ['piba', 'jiGra', 'Dama', 'tizWa', 'mana', 'yacCa', 'paSya',
 
 
 sarva_ardha = f('sarvadhatuka', 'ardhadhatuka')
+laghu = Sounds('at it ut ft xt')
 
 
 @F.TermFilter.no_params
 def puganta_laghupadha(term):
     # TODO: puganta
-    return term.upadha in Sounds('at it ut ft xt')
+    return term.upadha in laghu
 
 
 RULES = [
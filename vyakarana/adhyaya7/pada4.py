@@ -16,6 +16,8 @@ f = F.auto
 ac = Sounds('ac')
 shar = Sounds('Sar')
 khay = Sounds('Kay')
+hal = Sounds('hal')
+hal_r = Sounds('hal f')
 
 
 @O.Operator.no_params
@@ -40,8 +42,6 @@ def hal_shesha(state, index, locus=None):
 
 @F.AlFilter.no_params
 def dvihal(term):
-    hal = Sounds('hal')
-    hal_r = Sounds('hal f')
     return term.upadha in hal_r and term.antya in hal
 
 
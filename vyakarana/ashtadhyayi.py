@@ -59,9 +59,10 @@ class Ashtadhyayi(object):
 
         :param state: the current state
         """
+        terms = state.terms
         for ra, ia in self.rule_tree.candidates(state):
             # Ignore redundant applications
-            if ra in state[ia].ops:
+            if ra in terms[ia].ops:
                 continue
 
             # Only worthwhile rules
@@ -70,20 +71,29 @@ class Ashtadhyayi(object):
                 continue
 
             for s in ra_states:
-                logger.debug('  %s : %s --> %s' % (ra.name, state, s))
+                logger.debug('  %s : %s --> %s', ra.name, state, s)
             return ra_states
 
-    def _sandhi_asiddha(self, state):
+    def _sandhi_asiddha(self, state, seen=None):
         """Apply rules from the 'sandhi' and 'asiddha' sections.
 
         TODO: rewrite the rules in the sandhi and asiddha sections until
         this function is no longer needed.
 
         :param state: the current state
+        :param seen: if given, a set of results that were already
+                     yielded. Those results are skipped, and new ones are
+                     added to the set.
         """
+        if seen is None:
+            seen = set()
         for s in sandhi.apply(state):
             for t in siddha.asiddha(s):
-                yield ''.join(x.asiddha for x in t)
+                result = ''.join(x.asiddha for x in t)
+                if result in seen:
+                    continue
+                seen.add(result)
+                yield result
 
     def derive(self, sequence):
         """Yield all possible results.
@@ -93,16 +103,24 @@ class Ashtadhyayi(object):
         start = State(sequence)
         stack = [start]
 
-        logger.debug('---')
-        logger.debug('start: %s' % start)
+        # Bind hot attributes to locals once, outside the loop.
+        pop = stack.pop
+        extend = stack.extend
+        apply_next_rule = self._apply_next_rule
+        sandhi_asiddha = self._sandhi_asiddha
+        debug = logger.debug
+        seen = set()
+
+        debug('---')
+        debug('start: %s', start)
         while stack:
-            state = stack.pop()
-            new_states = self._apply_next_rule(state)
+            state = pop()
+            new_states = apply_next_rule(state)
             if new_states:
-                stack.extend(new_states)
+                extend(new_states)
 
             # No applicable rules; state is in its final form.
             else:
-                for result in self._sandhi_asiddha(state):
-                    logger.debug('yield: %s' % result)
+                for result in sandhi_asiddha(state, seen):
+                    debug('yield: %s', result)
                     yield result
@@ -11,14 +11,17 @@ class State(object):
 
     """A sequence of terms.
 
-    This represents a single step in some derivation."""
+    This represents a single step in some derivation. States are
+    never modified once they are returned, so they can be hashed and
+    used as dictionary keys."""
 
-    __slots__ = ['terms', 'history']
+    __slots__ = ['terms', 'history', '_hash']
 
     def __init__(self, terms=None, history=None):
         #: A list of terms.
         self.terms = terms or []
         self.history = history or []
+        self._hash = None
 
     def __eq__(self, other):
         if other is None:
@@ -31,6 +34,11 @@ class State(object):
     def __ne__(self, other):
         return not self == other
 
+    def __hash__(self):
+        if self._hash is None:
+            self._hash = hash(tuple(self.terms))
+        return self._hash
+
     def __getitem__(self, index):
         return self.terms[index]
 
@@ -63,28 +71,28 @@ class State(object):
     def copy(self):
         return State(self.terms[:], self.history[:])
 
+    # The methods below build only the list they change. `history` is
+    # never modified in place, so new states share it with this one.
+
     def insert(self, index, term):
-        c = self.copy()
-        c.terms.insert(index, term)
-        return c
+        terms = self.terms[:]
+        terms.insert(index, term)
+        return State(terms, self.history)
 
     def mark_rule(self, rule, index):
-        c = self.copy()
-        c.history.append((rule, index))
-        c.terms[index] = c.terms[index].add_op(rule)
-        return c
+        terms = self.terms[:]
+        terms[index] = terms[index].add_op(rule)
+        return State(terms, self.history + [(rule, index)])
 
     def remove(self, index):
-        c = self.copy()
-        c.terms.pop(index)
-        return c
+        terms = self.terms[:]
+        terms.pop(index)
+        return State(terms, self.history)
 
     def replace_all(self, terms):
-        c = self.copy()
-        c.terms = terms
-        return c
+        return State(terms, self.history)
 
     def swap(self, index, term):
-        c = self.copy()
-        c.terms[index] = term
-        return c
+        terms = self.terms[:]
+        terms[index] = term
+        return State(terms, self.history)
@@ -8,8 +8,9 @@
     :license: MIT and BSD
 """
 
+import csv
 import os
-from collections import defaultdict
+import sys
 
 vyak = os.path.dirname(os.path.dirname(__file__))
 DHATUPATHA_CSV = os.path.join(vyak, 'data', 'dhatupatha.csv')
@@ -52,13 +53,27 @@ class Dhatupatha(object):
     """
 
     def __init__(self, filename=None):
-        self.gana_map = {}
+        #: The gana of each dhatu in `self.all_dhatu`, by index.
+        self.gana_map = []
 
         #: List of all dhatu, one for each row in the original CSV file.
         self.all_dhatu = []
 
-        #: Maps a dhatu to its indices in `self.all_dhatu`.
-        self.index_map = defaultdict(list)
+        #: Maps a dhatu to its first index in `self.all_dhatu`.
+        self.index_map = {}
+
+        #: Maps a dhatu that appears more than once to all of its
+        #: indices in `self.all_dhatu`.
+        self.index_map_multi = {}
+
+        #: Maps a gana to the ``(start, end)`` slice of `self.all_dhatu`
+        #: that it occupies. Each gana is a contiguous run of rows.
+        self.gana_bounds = {}
+
+        # Maps (start, end) to the dhatus in that range. Queries are
+        # pure functions of their arguments, so results are reused.
+        self._list_cache = {}
+        self._set_cache = {}
 
         if filename is not None:
             self.init(filename)
@@ -71,15 +86,25 @@ class Dhatupatha(object):
         :param filename: path to the Dhatupatha file
         """
         with open(filename) as f:
-            i = 0
-            for line in f:
-                if line.startswith('#') or not line.strip():
-                    continue
-                gana, number, dhatu = line.strip().split(',')
-                self.all_dhatu.append(dhatu)
-                self.index_map[dhatu].append(i)
-                self.gana_map[i] = gana
-                i += 1
+            lines = [x.strip() for x in f.read().splitlines()
+                     if not x.startswith('#')]
+        rows = csv.reader(x for x in lines if x)
+
+        offset = len(self.all_dhatu)
+        for i, (gana, number, dhatu) in enumerate(rows, offset):
+            dhatu = sys.intern(dhatu)
+            self.all_dhatu.append(dhatu)
+            if dhatu in self.index_map:
+                indices = self.index_map_multi.setdefault(
+                    dhatu, [self.index_map[dhatu]])
+                indices.append(i)
+            else:
+                self.index_map[dhatu] = i
+            gana = sys.intern(gana)
+            self.gana_map.append(gana)
+
+            start, end = self.gana_bounds.get(gana, (i, i))
+            self.gana_bounds[gana] = (start, i + 1)
 
     def dhatu_list(self, start, end=None):
         """Get an inclusive list of of dhatus.
@@ -88,31 +113,37 @@ class Dhatupatha(object):
         :param end: the last dhatu in the list. If ``None``, add until
                     the end of the gana.
         """
-        start_index = self.index_map[start][0]
+        key = (start, end)
+        try:
+            return list(self._list_cache[key])
+        except KeyError:
+            returned = self._list_cache[key] = tuple(self._dhatu_list(*key))
+            return list(returned)
+
+    def _dhatu_list(self, start, end):
+        start_index = self.index_map[start]
 
         # From `start` to the end of the gana
         if end is None:
             gana = self.gana_map[start_index]
-            returned = []
-            end_index = start_index
-            while True:
-                try:
-                    dhatu = self.all_dhatu[end_index]
-                    if self.gana_map[end_index] == gana:
-                        returned.append(dhatu)
-                    else:
-                        return returned
-                except IndexError:
-                    return returned
-                end_index += 1
+            end_index = self.gana_bounds[gana][1]
+            return self.all_dhatu[start_index:end_index]
 
         # From start to last instance of `end` (inclusive)
         else:
-            end_index = self.index_map[end][-1]
+            try:
+                end_index = self.index_map_multi[end][-1]
+            except KeyError:
+                end_index = self.index_map[end]
             return self.all_dhatu[start_index:end_index + 1]
 
-    def dhatu_set(self, *args):
-        return frozenset(self.dhatu_list(*args))
+    def dhatu_set(self, start, end=None):
+        key = (start, end)
+        try:
+            return self._set_cache[key]
+        except KeyError:
+            returned = self._set_cache[key] = frozenset(self.dhatu_list(*key))
+            return returned
 
 
 #: A singleton instance available to all other modules. This has bad
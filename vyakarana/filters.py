@@ -19,13 +19,43 @@ from collections import defaultdict
 from . import lists
 from .dhatupatha import DHATUPATHA as DP
 from .sounds import Sounds
-from .terms import Upadesha
+from .terms import Upadesha, samjna_mask
 
 FILTER_NAME_MAX_ARGS = 4
-DHATU_SET = set(DP.all_dhatu)
+DHATU_SET = frozenset(DP.all_dhatu)
 
+_AC = Sounds('ac').values
+_HAL = Sounds('hal').values
 
-class Filter(object):
+
+class FilterType(type):
+
+    """Metaclass that reuses filters declared with the same arguments.
+
+    Filters are immutable, so ``samjna('kit')`` can safely return the
+    same object everywhere it appears. Only positional declarations
+    are cached; keyword construction (used for combined and
+    unparameterized filters) always creates a new filter.
+    """
+
+    def __call__(cls, *args, **kw):
+        if kw or not args:
+            return type.__call__(cls, *args, **kw)
+
+        key = (cls, args)
+        try:
+            return Filter.CACHE[key]
+        except KeyError:
+            pass
+        except TypeError:
+            # Unhashable arguments
+            return type.__call__(cls, *args)
+
+        returned = Filter.CACHE[key] = type.__call__(cls, *args)
+        return returned
+
+
+class Filter(object, metaclass=FilterType):
 
     """Represents a "test" on some input.
 
@@ -43,11 +73,18 @@ class Filter(object):
     """
 
     # An internal cache to avoid creating redundant filter objects.
-    # When a filter is declared, the constructor creates a `name` for
-    # the filter and checks it against the cache. If `name` is found
-    # in the cache, the cached result is returned instead.
+    # When a filter is declared with positional arguments, its class
+    # and arguments are checked against the cache. If they are found
+    # in the cache, the cached result is returned instead. See
+    # :class:`FilterType`.
     CACHE = {}
 
+    __slots__ = ('category', 'name', 'body', 'domain', 'cost',
+                 '_supersets', '_subset_cache')
+
+    #: The default for `self.cost`.
+    default_cost = 4
+
     def __init__(self, *args, **kw):
         #: The filter type. For example, a filter on the first letter
         #: of a term has the category ``adi``.
@@ -73,6 +110,11 @@ class Filter(object):
         #: - for an and/or/not filter, the original filters
         self.domain = self._make_domain(*args, **kw)
 
+        #: A rough estimate of how expensive `body` is to call.
+        #: Combined filters test their cheapest members first so that
+        #: they can short-circuit before calling the expensive ones.
+        self.cost = kw.get('cost', self.default_cost)
+
     def allows(self, state, index):
         return self.body(state, index)
 
@@ -129,7 +171,7 @@ class Filter(object):
         return '<f(%s)>' % self.name
 
     def _make_body(self, *args, **kw):
-        return kw.get('body') or self.body
+        return kw.get('body') or self._body
 
     def _make_category(self, *args, **kw):
         return kw.get('category') or self.__class__.__name__
@@ -204,8 +246,18 @@ class Filter(object):
 
         :param filters:
         """
+        checks = tuple(f._state_check() for f in _by_cost(filters))
+
+        # `&` always combines two filters, so skip the generator there.
+        if len(checks) == 2:
+            first, second = checks
+
+            def func(state, index):
+                return first(state, index) and second(state, index)
+            return func
+
         def func(state, index):
-            return all(f(state, index) for f in filters)
+            return all(c(state, index) for c in checks)
         return func
 
     @classmethod
@@ -217,8 +269,17 @@ class Filter(object):
 
         :param filters:
         """
+        checks = tuple(f._state_check() for f in _by_cost(filters))
+
+        if len(checks) == 2:
+            first, second = checks
+
+            def func(state, index):
+                return first(state, index) or second(state, index)
+            return func
+
         def func(state, index):
-            return any(f(state, index) for f in filters)
+            return any(c(state, index) for c in checks)
         return func
 
     @classmethod
@@ -230,10 +291,20 @@ class Filter(object):
 
         :param filt: a filter
         """
+        check = filt._state_check()
+
         def func(state, index):
-            return not filt.body(state, index)
+            return not check(state, index)
         return func
 
+    def _state_check(self):
+        """Return a function that tests this filter on (state, index).
+
+        Combined filters call this function directly, which saves a
+        method call per member on each test.
+        """
+        return self.body
+
     @classmethod
     def no_params(cls, fn):
         """Decorator constructor for unparameterized filters.
@@ -243,7 +314,10 @@ class Filter(object):
         category = name = fn.__name__
         domain = None
         body = fn
-        return cls(category=category, name=name, body=body, domain=domain)
+        # `fn` could do anything, so don't trust the class estimate.
+        cost = Filter.default_cost
+        return cls(category=category, name=name, body=body, domain=domain,
+                   cost=cost)
 
     @property
     def supersets(self):
@@ -273,7 +347,7 @@ class Filter(object):
         except AttributeError:
             pass
 
-        returned = self._supersets = set()
+        returned = set()
         stack = [self]
 
         # Recurse down the tree. If we can't split the filter, add it
@@ -287,6 +361,9 @@ class Filter(object):
                 # 'allow_all' is uninteresting.
                 if cur.name != 'allow_all':
                     returned.add(cur)
+
+        # Filters never change, so neither does this result.
+        returned = self._supersets = frozenset(returned)
         return returned
 
     def _domain_subset_of(self, other):
@@ -307,6 +384,23 @@ class Filter(object):
 
         :param other: a filter
         """
+        if self is other:
+            return True
+
+        try:
+            cache = self._subset_cache
+        except AttributeError:
+            cache = self._subset_cache = {}
+
+        try:
+            return cache[other]
+        except KeyError:
+            pass
+
+        returned = cache[other] = self._subset_of(other)
+        return returned
+
+    def _subset_of(self, other):
         s_sets = self.supersets
         o_sets = other.supersets
 
@@ -314,11 +408,10 @@ class Filter(object):
         # specific and has *more* components than `other`. If every
         # component of `other` (or something more specific) is in
         # `self`, then the subset relation holds.
-        for o in o_sets:
-            # Both filters share the condition.
-            if o in s_sets:
-                continue
-
+        #
+        # Conditions that both filters share hold trivially, so check
+        # only the conditions unique to `other`.
+        for o in o_sets - s_sets:
             # `o` is an "or" condition that must be matched by at least
             # one member of `s_sets`
             if o.category == 'or' and any(s in o.domain for s in s_sets):
@@ -336,6 +429,17 @@ class Filter(object):
         return True
 
 
+def _by_cost(filters):
+    """Return `filters` ordered from cheapest to most expensive.
+
+    Filter bodies have no side effects, so reordering the members of
+    an "and" or "or" never changes its result.
+
+    :param filters: a list of filters
+    """
+    return sorted(filters, key=lambda f: f.cost)
+
+
 class TermFilter(Filter):
 
     """A :class:`Filter` whose body takes an :class:`Upadesha` as input.
@@ -348,6 +452,8 @@ class TermFilter(Filter):
       for an unchanged term and avoid redundant calls.
     """
 
+    __slots__ = ()
+
     def allows(self, state, index):
         try:
             term = state[index]
@@ -359,17 +465,77 @@ class TermFilter(Filter):
         except IndexError:
             return False
 
+    def _state_check(self):
+        return self.allows
+
     @classmethod
     def _make_and_body(cls, filters):
-        bodies = [f.body for f in filters]
+        # `samjna` members are folded into bitmask tests on the term,
+        # which avoids a call per member.
+        filters = _by_cost(filters)
+        masks = tuple(f.mask for f in filters if type(f) is samjna)
+        bodies = tuple(f.body for f in filters if type(f) is not samjna)
+
+        # `&` always combines two filters, so skip the generator there.
+        if len(masks) == 1 and len(bodies) == 1:
+            mask, = masks
+            body, = bodies
+
+            def func(term):
+                return term.samjna_mask & mask != 0 and body(term)
+            return func
+
+        if not masks and len(bodies) == 2:
+            first, second = bodies
+
+            def func(term):
+                return first(term) and second(term)
+            return func
 
         def func(term):
+            if masks:
+                term_mask = term.samjna_mask
+                for mask in masks:
+                    if not term_mask & mask:
+                        return False
             return all(b(term) for b in bodies)
         return func
 
     @classmethod
     def _make_or_body(cls, filters):
-        bodies = [f.body for f in filters]
+        # A term matches any of several `samjna` members iff it shares
+        # a bit with the union of their masks, so they become one test.
+        filters = _by_cost(filters)
+        mask = 0
+        for f in filters:
+            if type(f) is samjna:
+                mask |= f.mask
+        bodies = tuple(f.body for f in filters if type(f) is not samjna)
+
+        if mask:
+            if not bodies:
+                def func(term):
+                    return term.samjna_mask & mask != 0
+                return func
+
+            if len(bodies) == 1:
+                body, = bodies
+
+                def func(term):
+                    return term.samjna_mask & mask != 0 or body(term)
+                return func
+
+            def func(term):
+                return (term.samjna_mask & mask != 0 or
+                        any(b(term) for b in bodies))
+            return func
+
+        if len(bodies) == 2:
+            first, second = bodies
+
+            def func(term):
+                return first(term) or second(term)
+            return func
 
         def func(term):
             return any(b(term) for b in bodies)
@@ -377,8 +543,10 @@ class TermFilter(Filter):
 
     @classmethod
     def _make_not_body(cls, filt):
+        body = filt.body
+
         def func(term):
-            return not filt.body(term)
+            return not body(term)
         return func
 
 
@@ -386,6 +554,9 @@ class AlFilter(TermFilter):
 
     """A filter that tests letter properties."""
 
+    __slots__ = ()
+    default_cost = 2
+
     def _make_domain(self, domain_str=None, *args, **kw):
         if domain_str is None:
             return None
@@ -400,15 +571,28 @@ class AlFilter(TermFilter):
 
 
 class SamjnaFilter(TermFilter):
-    pass
+
+    __slots__ = ('mask',)
+    default_cost = 1
+
+    def __init__(self, *args, **kw):
+        TermFilter.__init__(self, *args, **kw)
+
+        #: `self.domain` as a bitmask, for comparison against
+        #: :attr:`Upadesha.samjna_mask`.
+        self.mask = samjna_mask(self.domain or ())
 
 
 class UpadeshaFilter(TermFilter):
-    pass
+
+    __slots__ = ()
+    default_cost = 1
 
 
 class DhatuFilter(UpadeshaFilter):
 
+    __slots__ = ()
+
     @property
     def supersets(self):
         try:
@@ -417,7 +601,7 @@ class DhatuFilter(UpadeshaFilter):
             antya = ' '.join(Upadesha(x).antya for x in self.domain)
             _al = al(antya)
             _samjna = samjna('dhatu')
-            self._supersets = set([self, _samjna, _al])
+            self._supersets = frozenset([self, _samjna, _al])
             return self._supersets
 
 
@@ -430,31 +614,40 @@ class adi(AlFilter):
 
     """Filter on a term's first sound."""
 
-    def body(self, term):
-        return term.adi in self.domain
+    __slots__ = ()
+
+    def _body(self, term):
+        return term.adi in self.domain.values
 
 
 class al(AlFilter):
 
     """Filter on a term's final sound."""
 
-    def body(self, term):
-        return term.antya in self.domain
+    __slots__ = ()
+
+    def _body(self, term):
+        return term.antya in self.domain.values
 
 
 class contains(AlFilter):
 
     """Filter on whether a term has a certain sound."""
 
-    def body(self, term):
-        return any(s in term.value for s in self.domain)
+    __slots__ = ()
+    default_cost = 3
+
+    def _body(self, term):
+        return not self.domain.values.isdisjoint(term.value)
 
 
 class dhatu(DhatuFilter):
 
     """Filter on whether a term represents a particular dhatu."""
 
-    def body(self, term):
+    __slots__ = ()
+
+    def _body(self, term):
         return term.raw in self.domain and 'dhatu' in term.samjna
 
 
@@ -475,23 +668,31 @@ class lakshana(UpadeshaFilter):
 
     """Filter on a term's prior values."""
 
-    def body(self, term):
-        return any(x in term.lakshana for x in self.domain)
+    __slots__ = ()
+    default_cost = 3
+
+    def _body(self, term):
+        return not self.domain.isdisjoint(term.lakshana)
 
 
 class part(TermFilter):
 
     """Filter on a term's augments."""
 
-    def body(self, term):
-        return any(x in term.parts for x in self.domain)
+    __slots__ = ()
+    default_cost = 3
+
+    def _body(self, term):
+        return not self.domain.isdisjoint(term.parts)
 
 
 class raw(UpadeshaFilter):
 
     """Filter on a term's raw value."""
 
-    def body(self, term):
+    __slots__ = ()
+
+    def _body(self, term):
         return term.raw in self.domain
 
 
@@ -499,23 +700,29 @@ class samjna(SamjnaFilter):
 
     """Filter on a term's designations."""
 
-    def body(self, term):
-        return any(x in term.samjna for x in self.domain)
+    __slots__ = ()
+
+    def _body(self, term):
+        return term.samjna_mask & self.mask != 0
 
 
 class upadha(AlFilter):
 
     """Filter on a term's penultimate sound."""
 
-    def body(self, term):
-        return term.upadha in self.domain
+    __slots__ = ()
+
+    def _body(self, term):
+        return term.upadha in self.domain.values
 
 
 class value(UpadeshaFilter):
 
     """Filter on a term's current value."""
 
-    def body(self, term):
+    __slots__ = ()
+
+    def _body(self, term):
         return term.value in self.domain
 
 
@@ -541,32 +748,37 @@ def allow_all(*args):
     return True
 
 
+#: Maps a term value to the result of :func:`ekac`.
+_EKAC_CACHE = {}
+
+
 @AlFilter.no_params
 def ekac(term):
-    seen = False
-    ac = Sounds('ac')
-    for L in term.value:
-        if L in ac:
-            if seen:
-                return False
-            seen = True
-    return True
+    """Filter on whether a term has at most one vowel.
+
+    Terms share a small set of values, so results are cached by value.
+    """
+    value = term.value
+    try:
+        return _EKAC_CACHE[value]
+    except KeyError:
+        pass
+    returned = _EKAC_CACHE[value] = sum(1 for L in value if L in _AC) <= 1
+    return returned
 
 
 @AlFilter.no_params
 def samyoga(term):
     """Filter on whether a term ends with a conjunct."""
-    hal = Sounds('hal')
-    return term.antya in hal and term.upadha in hal
+    return term.antya in _HAL and term.upadha in _HAL
 
 
 @AlFilter.no_params
 def samyogadi(term):
     """Filter on whether a term begins with a conjunct."""
     value = term.value
-    hal = Sounds('hal')
     try:
-        return value[0] in hal and value[1] in hal
+        return value[0] in _HAL and value[1] in _HAL
     except IndexError:
         return False
 
@@ -575,9 +787,8 @@ def samyogadi(term):
 def samyogapurva(term):
     """Filter on whether a term's final sound follows a conjunct."""
     value = term.value
-    hal = Sounds('hal')
     try:
-        return value[-3] in hal and value[-2] in hal
+        return value[-3] in _HAL and value[-2] in _HAL
     except IndexError:
         return False
 
@@ -594,6 +805,24 @@ each = term_placeholder
 # Automatic filter
 # ~~~~~~~~~~~~~~~~
 
+#: Names that :func:`auto` interprets as samjna.
+AUTO_SAMJNA = lists.SAMJNA | lists.IT
+
+#: Maps a filter type to its creator, in the order that :func:`auto`
+#: combines them.
+AUTO_CREATORS = (
+    ('raw', raw),
+    ('dhatu', dhatu),
+    ('lakshana', lakshana),
+    ('samjna', samjna),
+    ('al', al),
+)
+
+# Results of :func:`auto`, keyed by its arguments. Many rules use the
+# same context, and each call would otherwise build a new filter.
+_AUTO_CACHE = {}
+
+
 def auto(*data):
     """Create a new :class:`Filter` using the given *data*.
 
@@ -611,6 +840,20 @@ def auto(*data):
 
     :param data: arbitrary data, usually a list of strings
     """
+    try:
+        return _AUTO_CACHE[data]
+    except KeyError:
+        pass
+
+    returned = _AUTO_CACHE[data] = _auto(data)
+    return returned
+
+
+def _auto(data):
+    """Create the filter for :func:`auto`.
+
+    :param data: a tuple of arbitrary data
+    """
 
     # Maps a filter type to a list of selectors. This is populated in
     # the loop below.
@@ -623,7 +866,7 @@ def auto(*data):
 
         # String selector: value, samjna, or sound
         if isinstance(datum, str):
-            if datum in lists.SAMJNA or datum in lists.IT:
+            if datum in AUTO_SAMJNA:
                 key = 'samjna'
             elif datum in lists.SOUNDS:
                 key = 'al'
@@ -645,17 +888,9 @@ def auto(*data):
 
     # Create filter
     base_filter = None
-    name2creator = {
-        'raw': raw,
-        'dhatu': dhatu,
-        'lakshana': lakshana,
-        'samjna': samjna,
-        'al': al
-    }
-    for name in name2creator:
+    for name, filt_creator in AUTO_CREATORS:
         values = parsed[name]
         if values:
-            filt_creator = name2creator[name]
             filt = filt_creator(*values)
             if base_filter is None:
                 base_filter = filt
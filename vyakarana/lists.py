@@ -20,14 +20,14 @@ TIN = ['tip', 'tas', 'Ji', 'sip', 'Tas', 'Ta', 'mip', 'vas', 'mas',
 
 #: Abstract suffixes that are replaced with items from `TIN`.
 #: Collectively, they are called the "lakāra" or just "la".
-LA = set([
+LA = frozenset([
     'la~w', 'li~w', 'lu~w', 'lf~w', 'le~w', 'lo~w',
     'la~N', 'li~N', 'lu~N', 'lf~N'
 ])
 
 
 #: Various pratyaya
-PRATYAYA = set([
+PRATYAYA = frozenset([
     'luk', 'Slu', 'lup',
     'Sap', 'Syan', 'Snu', 'Sa', 'Snam', 'u', 'SnA',
     'Ric', 'Rin'
@@ -35,7 +35,7 @@ PRATYAYA = set([
 
 
 #: Technical designations (1.3.2 - 1.3.9)
-IT = (set([L + 'it' for L in 'kKGNcYwqRpmS'])
+IT = (frozenset([L + 'it' for L in 'kKGNcYwqRpmS'])
       | set([L + 'dit' for L in 'aiuUfxo'])
       | set(['qvit', 'wvit'])
       | set(['svaritet', 'anudattet', 'svarita', 'anudatta']))
@@ -67,7 +67,7 @@ KARAKA = ['karta', 'karma', 'karana', 'adhikarana', 'sampradana', 'apadana']
 
 
 #: All saṃjñā
-SAMJNA = set([
+SAMJNA = frozenset([
     'guna', 'vrddhi',
     'dhatu', 'anga', 'pada', 'pratyaya',
     'krt', 'taddhita',
@@ -81,7 +81,7 @@ SAMJNA = set([
 #: - savarṇa sets (1.1.69)
 #: - single-item sets (1.1.70)
 #: - pratyāhāra (1.1.71)
-SOUNDS = set([
+SOUNDS = frozenset([
     # 1.1.69 aṇudit savarṇasya cāpratyayaḥ
     'a', 'i', 'u', 'f', 'x',
     'ku~', 'cu~', 'wu~', 'tu~', 'pu~',
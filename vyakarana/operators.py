@@ -14,8 +14,79 @@
     :license: MIT and BSD
 """
 
+import re
+
 from .sounds import Sound, Sounds
 
+_AC = Sounds('ac').values
+_AR = Sounds('aR').values
+_YAR = Sounds('yaR').values
+
+_DIRGHA_TABLE = str.maketrans('aiufx', 'AIUFX')
+_GUNA_MAP = dict(zip('iIuUfFxX', 'eeooaaaa'))
+_HRASVA_TABLE = str.maketrans('AIUFXeEoO', 'aiufxiiuu')
+_VRDDHI_MAP = dict(zip('iIuUfFxX', 'EEOOAAAA'))
+_SAMPRASARANA = dict((L, Sound(L).closest('ifxu')) for L in _YAR)
+
+
+def _char_class(chars):
+    """Return a regex character class that matches any of `chars`."""
+    return '[%s]' % re.escape(''.join(sorted(chars)))
+
+
+_DIRGHA_RE = re.compile(_char_class('aiufx'))
+_HRASVA_RE = re.compile(_char_class('AIUFXeEoO'))
+_IK_RE = re.compile(_char_class('iIuUfFxX'))
+_LAST_AC_RE = re.compile('.*(%s)' % _char_class(_AC), re.S)
+_LAST_YAR_RE = re.compile('.*(%s)' % _char_class(_YAR), re.S)
+
+
+def _convert_ik(value, converter):
+    """Convert the first *ik* vowel in `value` with `converter`.
+
+    1.1.51 ur aṇ raparaḥ
+    A replacement for *ṛ* or *ṝ* is followed by *r*.
+
+    :param value: the value to change
+    :param converter: maps each *ik* vowel to its replacement
+    """
+    m = _IK_RE.search(value)
+    if m is None:
+        return value
+    i = m.start()
+    L = value[i]
+    if L in 'fF':
+        return value[:i] + converter[L] + 'r' + value[i + 1:]
+    return value[:i] + converter[L] + value[i + 1:]
+
+
+def _translate_first(value, regex, table):
+    """Translate the first match of `regex` in `value` with `table`.
+
+    :param value: the value to change
+    :param regex: a compiled regex that matches a single sound
+    :param table: a table for :meth:`str.translate`
+    """
+    m = regex.search(value)
+    if m is None:
+        return value
+    i = m.start()
+    return value[:i] + value[i].translate(table) + value[i + 1:]
+
+
+def _ac_offset(value):
+    """Return the number of sounds that follow the last vowel in `value`.
+
+    If `value` has no vowels, return ``len(value) - 1``.
+
+    :param value: some value
+    """
+    m = _LAST_AC_RE.match(value)
+    if m is None:
+        return len(value) - 1
+    return len(value) - 1 - m.start(1)
+
+
 conflicts = [
     ('dirgha', 'hrasva'),
     ('insert', ),
@@ -24,11 +95,17 @@ conflicts = [
     ('ti', 'tasya'),
 ]
 
+#: Maps an operator category to the index of its group in `conflicts`.
+conflict_group = dict((category, i) for i, group in enumerate(conflicts)
+                      for category in group)
+
 
 class Operator(object):
 
     """A callable class that returns states."""
 
+    __slots__ = ('category', 'name', 'body', 'params')
+
     def __init__(self, *args, **kw):
         #: The operator type. For example, a substitution operator has
         #: category ``tasya``.
@@ -138,10 +215,10 @@ class Operator(object):
 
         :param other: an operator
         """
-        for c in conflicts:
-            if self.category in c and other.category in c:
-                return True
-        return False
+        group = conflict_group.get(self.category)
+        if group is None:
+            return False
+        return group == conflict_group.get(other.category)
 
 
 class DataOperator(Operator):
@@ -151,6 +228,8 @@ class DataOperator(Operator):
     `body` accepts and returns a single string.
     """
 
+    __slots__ = ()
+
     def apply(self, state, index, locus='value'):
         cur = state[index]
         _input = cur.value
@@ -184,16 +263,23 @@ def al_tasya(target, result):
     target = Sounds(target)
     result = Sounds(result)
 
+    target_re = re.compile(_char_class(target.values))
+
+    # Each target sound has a fixed replacement, so find them all now.
+    converter = {}
+    for L in target.values:
+        new = Sound(L).closest(result)
+        # 1.1.51 ur aṇ raparaḥ
+        if L in 'fF' and new in _AR:
+            new += 'r'
+        converter[L] = new
+
     def func(value):
-        letters = list(value)
-        for i, L in enumerate(letters):
-            if L in target:
-                letters[i] = Sound(L).closest(result)
-                # 1.1.51 ur aṇ raparaḥ
-                if L in 'fF' and letters[i] in Sounds('aR'):
-                    letters[i] += 'r'
-                break
-        return ''.join(letters)
+        m = target_re.search(value)
+        if m is None:
+            return value
+        i = m.start()
+        return value[:i] + converter[value[i]] + value[i + 1:]
     return func
 
 
@@ -211,67 +297,92 @@ def replace(target, result):
     return func
 
 
+def _tasya_kind(sthani, adi):
+    """Return the kind of substitution that `sthani` performs.
+
+    :param sthani: the substitute
+    :param adi: ``True`` iff the substitute replaces the first sound
+    """
+    # 1.1.54 ādeḥ parasya
+    if adi:
+        return 'adi' if hasattr(sthani, 'value') else 'adi_str'
+
+    elif isinstance(sthani, str):
+        return 'str'
+
+    elif not hasattr(sthani, 'value'):
+        return 'sound'
+
+    samjna = sthani.samjna
+    for kind in ('mit', 'kit', 'wit'):
+        if kind in samjna:
+            return kind
+
+    if len(sthani.value) == 1 or 'Nit' in samjna:
+        return 'antya'
+    elif 'Sit' in samjna or len(sthani.value) > 1:
+        return 'sarva'
+    return None
+
+
+def _tasya_sound(term, value, sthani):
+    # 1.1.50 sthāne 'ntaratamaḥ
+    last = Sound(term.antya).closest(sthani)
+    return value[:-1] + last
+
+
+def _tasya_str(term, value, sthani):
+    # 1.1.52 alo 'ntyasya
+    # 1.1.55 anekālśit sarvasya
+    if len(sthani) <= 1:
+        return value[:-1] + sthani
+    return sthani
+
+
+def _tasya_mit(term, value, sthani):
+    # 1.1.47 mid aco 'ntyāt paraḥ
+    i = _ac_offset(value)
+    return value[:-i] + sthani.value + value[-i:]
+
+
+def _tasya_unknown(term, value, sthani):
+    raise NotImplementedError(sthani)
+
+
+#: Maps a kind from :func:`_tasya_kind` to a function that accepts a
+#: term, its current value, and the substitute and returns a new value.
+_TASYA_DISPATCH = {
+    'adi': lambda term, value, sthani: sthani.value + value[1:],
+    'adi_str': lambda term, value, sthani: sthani + value[1:],
+    'str': _tasya_str,
+    'sound': _tasya_sound,
+    'mit': _tasya_mit,
+    # 1.1.46 ādyantau ṭakitau
+    'kit': lambda term, value, sthani: value + sthani.value,
+    'wit': lambda term, value, sthani: sthani.value + value,
+    # 1.1.52 alo 'ntyasya
+    # 1.1.53 ṅic ca
+    'antya': lambda term, value, sthani: value[:-1] + sthani.value,
+    # 1.1.55 anekālśit sarvasya
+    'sarva': lambda term, value, sthani: sthani.value,
+    None: _tasya_unknown,
+}
+
+
 @Operator.parameterized
 def tasya(sthani, adi=False):
+    # The substitute is fixed, so choose the substitution once.
+    kind = _tasya_kind(sthani, adi)
+    substitute = _TASYA_DISPATCH[kind]
+    add_part = kind in ('mit', 'kit', 'wit')
+
     def func(state, index, locus):
         term = state[index]
-        term_value = term.get_at(locus)
-        new_value = None
-        add_part = False
-
-        # 1.1.54 ādeḥ parasya
-        if adi:
-            try:
-                new_value = sthani.value + term_value[1:]
-            except AttributeError:
-                new_value = sthani + term_value[1:]
-
-        elif isinstance(sthani, str):
-            # 1.1.52 alo 'ntyasya
-            # 1.1.55 anekālśit sarvasya
-            if len(sthani) <= 1:
-                new_value = term_value[:-1] + sthani
-            else:
-                new_value = sthani
-
-        elif not hasattr(sthani, 'value'):
-            # 1.1.50 sthāne 'ntaratamaḥ
-            last = Sound(term.antya).closest(sthani)
-            new_value = term_value[:-1] + last
-
-        # 1.1.47 mid aco 'ntyāt paraḥ
-        elif 'mit' in sthani.samjna:
-            ac = Sounds('ac')
-            for i, L in enumerate(reversed(term_value)):
-                if L in ac:
-                    break
-            new_value = term_value[:-i] + sthani.value + term_value[-i:]
-            add_part = True
-
-        # 1.1.46 ādyantau ṭakitau
-        elif 'kit' in sthani.samjna:
-            new_value = term_value + sthani.value
-            add_part = True
-        elif 'wit' in sthani.samjna:
-            new_value = sthani.value + term_value
-            add_part = True
-
-        # 1.1.52 alo 'ntyasya
-        # 1.1.53 ṅic ca
-        elif len(sthani.value) == 1 or 'Nit' in sthani.samjna:
-            new_value = term_value[:-1] + sthani.value
-
-        # 1.1.55 anekālśit sarvasya
-        elif 'S' in sthani.it or len(sthani.value) > 1:
-            new_value = sthani.value
-
-        if new_value is not None:
-            new_term = term.set_at(locus, new_value)
-            if add_part:
-                new_term = new_term.add_part(sthani.raw)
-            return state.swap(index, new_term)
-
-        raise NotImplementedError(sthani)
+        new_value = substitute(term, term.get_at(locus), sthani)
+        new_term = term.set_at(locus, new_value)
+        if add_part:
+            new_term = new_term.add_part(sthani.raw)
+        return state.swap(index, new_term)
 
     return func
 
@@ -285,12 +396,8 @@ def ti(result):
 
     :param result: the replacement
     """
-    ac = Sounds('ac')
-
     def func(value):
-        for i, L in enumerate(reversed(value)):
-            if L in ac:
-                break
+        i = _ac_offset(value)
         return value[:-(i + 1)] + result
 
     return func
@@ -316,7 +423,7 @@ def upadha(result):
 
 @Operator.parameterized
 def yathasamkhya(targets, results):
-    converter = dict(list(zip(targets, results)))
+    converter = dict(zip(targets, results))
 
     def func(state, index, locus):
         cur = state[index]
@@ -331,14 +438,7 @@ def yathasamkhya(targets, results):
 
 @DataOperator.no_params
 def dirgha(value):
-    converter = dict(list(zip('aiufx', 'AIUFX')))
-    letters = list(value)
-    for i, L in enumerate(letters):
-        if L in converter:
-            letters[i] = converter[L]
-            break
-
-    return ''.join(letters)
+    return _translate_first(value, _DIRGHA_RE, _DIRGHA_TABLE)
 
 
 @Operator.no_params
@@ -355,55 +455,31 @@ def guna(state, index, locus=None):
 
     # 1.1.2 adeG guNaH
     # 1.1.3 iko guNavRddhI
-    converter = dict(list(zip('iIuUfFxX', 'eeooaaaa')))
-    letters = list(cur.value)
-    for i, L in enumerate(letters):
-        if L in converter:
-            letters[i] = converter[L]
-            if L in 'fF':
-                letters[i] += 'r'
-            break
-
-    cur = cur.set_value(''.join(letters)).add_samjna('guna')
+    cur = cur.set_value(_convert_ik(cur.value, _GUNA_MAP)).add_samjna('guna')
     return state.swap(index, cur)
 
 
 @DataOperator.no_params
 def hrasva(value):
-    converter = dict(list(zip('AIUFXeEoO', 'aiufxiiuu')))
-    letters = list(value)
-    for i, L in enumerate(letters):
-        if L in converter:
-            letters[i] = converter[L]
-            break
-
-    return ''.join(letters)
+    return _translate_first(value, _HRASVA_RE, _HRASVA_TABLE)
 
 
 @DataOperator.no_params
 def samprasarana(value):
-    rev_letters = list(reversed(value))
-    found = False
-    for i, L in enumerate(rev_letters):
-        # 1.1.45 ig yaNaH saMprasAraNAm
-        # TODO: enforce short vowels automatically
-        if L in Sounds('yaR'):
-            rev_letters[i] = Sound(L).closest('ifxu')
-            found = True
-            break
-
-    if not found:
+    m = _LAST_YAR_RE.match(value)
+    if m is None:
         return value
 
+    # 1.1.45 ig yaNaH saMprasAraNAm
+    # TODO: enforce short vowels automatically
+    i = m.start(1)
+    after = value[i + 1:]
+
     # 6.4.108 saMprasAraNAc ca
-    try:
-        L = rev_letters[i - 1]
-        if L in Sounds('ac'):
-            rev_letters[i - 1] = ''
-    except IndexError:
-        pass
+    if after[:1] in _AC:
+        after = after[1:]
 
-    return ''.join(reversed(rev_letters))
+    return value[:i] + _SAMPRASARANA[value[i]] + after
 
 
 @Operator.no_params
@@ -416,35 +492,16 @@ def vrddhi(state, index, locus=None):
 
     # 1.1.5 kGiti ca (na)
     if right and right.any_samjna('kit', 'Nit'):
-        cur = cur
         return state.swap(index, cur)
 
     # 1.1.1 vRddhir Adaic
     # 1.1.3 iko guNavRddhI
-    converter = dict(list(zip('iIuUfFxX', 'EEOOAAAA')))
-    letters = list(cur.value)
-    for i, L in enumerate(letters):
-        if L in converter:
-            letters[i] = converter[L]
-            if L in 'fF':
-                letters[i] += 'r'
-            break
-
-    cur = cur.set_value(''.join(letters))
+    cur = cur.set_value(_convert_ik(cur.value, _VRDDHI_MAP))
     return state.swap(index, cur)
 
 
 @Operator.no_params
 def force_guna(state, index, locus=None):
     cur = state[index]
-    converter = dict(list(zip('iIuUfFxX', 'eeooaaaa')))
-    letters = list(cur.value)
-    for i, L in enumerate(letters):
-        if L in converter:
-            letters[i] = converter[L]
-            if L in 'fF':
-                letters[i] += 'r'
-            break
-
-    cur = cur.set_value(''.join(letters)).add_samjna('guna')
+    cur = cur.set_value(_convert_ik(cur.value, _GUNA_MAP)).add_samjna('guna')
     return state.swap(index, cur)
@@ -87,6 +87,15 @@ class Rule(object):
 
         return result.mark_rule(self, index)
 
+    def _finalize(self, state, index):
+        """Mark `state` with this rule and block all utsarga rules.
+
+        :param state: a state
+        :param index: the index where the first filter is applied.
+        """
+        new = state.mark_rule(self, index)
+        return new.swap(index, new[index].add_op(*self.utsarga))
+
     def apply(self, state, index):
         """Apply this rule and yield the results.
 
@@ -100,27 +109,33 @@ class Rule(object):
         # 'na' rule. Apply no operation, but block any general rules
         # from applying.
         if self.modifier is Na:
-            new = state.mark_rule(self, index)
-            new = new.swap(index, new[index].add_op(*self.utsarga))
-            yield new
+            yield self._finalize(state, index)
             return
 
         # Mandatory, or option accepted. Apply the operator and yield.
-        # Also, block all utsarga rules.
         #
         # We yield only if the state is different; otherwise the system
         # will loop.
         new = self.operator.apply(state, index + self.offset, self.locus)
-        if new != state or self.optional:
-            new = new.mark_rule(self, index)
-            new = new.swap(index, new[index].add_op(*self.utsarga))
-            yield new
+        if self.optional or new != state:
+            yield self._finalize(new, index)
 
     def features(self):
+        """Return the ``(filter, offset)`` pairs that this rule requires.
+
+        Rules don't change after they're created, so the result is
+        computed once and returned as a frozenset.
+        """
+        try:
+            return self._features
+        except AttributeError:
+            pass
+
         feature_set = set()
         for i, filt in enumerate(self.filters):
             feature_set.update((f, i) for f in filt.supersets)
-        return feature_set
+        self._features = frozenset(feature_set)
+        return self._features
 
     def has_apavada(self, other):
         """Return whether the other rule is an apavada to this one.
@@ -142,36 +157,21 @@ class Rule(object):
         if self.name == other.name:
             return False
 
-        # Condition 2
-        # print('self: ', end=' ')
-        # self.pprint()
-        # print('other: ', end=' ')
-        # other.pprint()
-
-        # for f1 in self.filters:
-        #     print('cheking for filter:', f1)
-        #     foundFilter = False
-        #     for f2 in other.filters:
-        #         print('comparing in filter:', f2)
-        #         if f2.subset_of(f1):
-        #             foundFilter = True
-        #             break
-        #     if not foundFilter:
-        #         return False
-
-        filter_pairs = list(zip(self.filters, other.filters))
-        # for f1, f2 in filter_pairs:
-        #     print('filter pairs:', f1, f2)
-        # print('\tsub set:', all(f2.subset_of(f1) for f1, f2 in filter_pairs))
-        if not all(f2.subset_of(f1) for f1, f2 in filter_pairs):
-            return False
+        # Conditions 3 and 4 are cheap lookups, so test them before the
+        # filter-by-filter comparison in condition 2.
 
         # Condition 3
         if self.locus != other.locus:
             return False
 
         # Condition 4
-        return self.operator.conflicts_with(other.operator)
+        if not self.operator.conflicts_with(other.operator):
+            return False
+
+        # Condition 2. Filters are shared, so identical filters are
+        # common and trivially subsets of each other.
+        filter_pairs = zip(self.filters, other.filters)
+        return all(f1 is f2 or f2.subset_of(f1) for f1, f2 in filter_pairs)
 
     def pprint(self):
         data = []
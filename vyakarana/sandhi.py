@@ -2,13 +2,24 @@ from . import operators as O
 from .derivations import State
 from .sounds import Sound, Sounds
 from .terms import Upadesha
-from .util import SoundEditor
 
 
 def convert(op):
-    """A temporary fix to a deeper problem."""
+    """A temporary fix to a deeper problem.
+
+    The result depends only on `s`, so it is cached rather than
+    building a new term and state for each call.
+    """
+    cache = {}
+
     def func(s):
-        return op.apply(State([Upadesha(s + 'a~')]), 0)[0].value
+        try:
+            return cache[s]
+        except KeyError:
+            pass
+        value = op.apply(State([Upadesha(s + 'a~')]), 0)[0].value
+        cache[s] = value
+        return value
     return func
 
 
@@ -17,21 +28,54 @@ iko_yan_aci = O.al_tasya('ik', 'yaR').body
 guna = convert(O.guna)
 vrddhi = convert(O.vrddhi)
 
+_AYADI_MAP = dict(zip('eEoO', 'ay Ay av Av'.split()))
+
+_AC = Sounds('ac').values
+_HAL = Sounds('hal').values
+_AT_EN = Sounds('at eN').values
+_IK = Sounds('ik').values
+_EC = Sounds('ec').values
+_IC = Sounds('ic').values
+_VY = Sounds('v y').values
+_VAL = Sounds('val').values
 
-def apply(state):
-    editor = SoundEditor(state)
-    for cur in iter(editor):
-        next = cur.next
-        if next.value is None:
-            continue
 
-        x, y = cur.value, next.value
-        if x in Sounds('ac'):
-            cur.value, next.value = ac_sandhi(x, y)
-        elif x in Sounds('hal'):
-            cur.value, next.value = hal_sandhi(x, y)
+def apply(state):
+    # Scan one flat list of letters for the whole state, then split it
+    # back into terms. A letter removed by sandhi becomes '', so every
+    # term keeps its original span of the list.
+    values = [term.asiddha for term in state]
+    letters = list(''.join(values))
+
+    table = _SANDHI_TABLE
+    for k in range(1, len(letters)):
+        x, y = letters[k - 1], letters[k]
+        # Values changed by an earlier pair (e.g. by guna) may not be
+        # single sounds, so fall back to the rules themselves.
+        result = table.get((x, y)) or sandhi(x, y)
+        if result is not None:
+            letters[k - 1], letters[k] = result
+
+    new_terms = []
+    start = 0
+    for term, value in zip(state, values):
+        end = start + len(value)
+        new_terms.append(term.set_at('asiddha', ''.join(letters[start:end])))
+        start = end
+    yield state.replace_all(new_terms)
+
+
+def sandhi(x, y):
+    """Apply the rules of sandhi to `x` as followed by `y`.
 
-    yield editor.join()
+    :param x: the first letter.
+    :param y: the second letter.
+    :returns: the pair ``(x, y)`` after sandhi, or ``None`` if no
+              sandhi rules apply to `x`.
+    """
+    handler = _HANDLERS.get(x)
+    if handler is not None:
+        return handler(x, y)
 
 
 def ac_sandhi(x, y):
@@ -45,7 +89,7 @@ def ac_sandhi(x, y):
     """
 
     # 6.1.97 ato guNe
-    if x == 'a' and y in Sounds('at eN'):
+    if x == 'a' and y in _AT_EN:
         x = ''
 
     # 6.1.101 akaH savarNe dIrghaH
@@ -54,20 +98,19 @@ def ac_sandhi(x, y):
         y = dirgha(y)
 
     # 6.1.77 iko yaN aci
-    elif x in Sounds('ik') and y in Sounds('ac'):
+    elif x in _IK and y in _AC:
         x = iko_yan_aci(x)
 
     # 6.1.78 eco 'yavAyAvaH
-    elif x in Sounds('ec') and y in Sounds('ac'):
-        converter = dict(list(zip('eEoO', 'ay Ay av Av'.split())))
-        x = converter[x]
+    elif x in _EC and y in _AC:
+        x = _AYADI_MAP[x]
 
-    elif x in 'aA' and y in Sounds('ic'):
+    elif x in 'aA' and y in _IC:
         x = ''
 
         # 6.1.87 Ad guNaH
         # 6.1.88 vRddhir eci
-        y = vrddhi(y) if y in Sounds('ec') else guna(y)
+        y = vrddhi(y) if y in _EC else guna(y)
 
     return x, y
 
@@ -83,7 +126,20 @@ def hal_sandhi(x, y):
     """
 
     # 6.1.66 lopo vyor vali
-    if x in Sounds('v y') and y in Sounds('val'):
+    if x in _VY and y in _VAL:
         x = ''
 
     return x, y
+
+
+#: Maps a sound to the function that applies sandhi after it.
+_HANDLERS = dict.fromkeys(_AC, ac_sandhi)
+_HANDLERS.update(dict.fromkeys(_HAL, hal_sandhi))
+
+#: Maps a pair of sounds ``(x, y)`` to the result of :func:`sandhi`.
+#: Every pair of single sounds is a key.
+_SANDHI_TABLE = {}
+for _x in Sounds('al').values:
+    for _y in Sounds('al').values:
+        _SANDHI_TABLE[(_x, _y)] = sandhi(_x, _y)
+del _x, _y
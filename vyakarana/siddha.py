@@ -11,6 +11,28 @@ from .sounds import Sounds, Sound, Pratyahara
 from .terms import Upadesha
 from .util import SoundEditor, SoundIndex
 
+_HAL = Sounds('hal').values
+_JHAL = Sounds('Jal').values
+_JHAZ = Sounds('Jaz').values
+_JHAS = Sounds('JaS').values
+_JAS = Sounds('jaS').values
+_KHAR = Sounds('Kar').values
+_CAR = Sounds('car').values
+_CAR_JAS = Sounds('car jaS').values
+_YAY = Sounds('yay').values
+_CU = Sounds('cu').values
+_KU = Sounds('ku').values
+_IN_KU = Sounds('iN ku').values
+_IR = Pratyahara('iR', second_R=True).values
+_AW_KU_PU = Sounds('aw ku pu').values
+_S_TU = Sounds('s tu').values
+_S_CU = Sounds('S cu').values
+_Z_WU = Sounds('z wu').values
+
+#: 8.2.36
+VRASCA_BHRASJA = frozenset(['vraSc', 'Brasj', 'sfj', 'mfj', 'yaj', 'rAj',
+                            'BrAj'])
+
 
 def asiddha_helper(state):
     """Chapter 8.2 of the Ashtadhyayi starts the 'asiddha' section of
@@ -41,26 +63,25 @@ def asiddha_helper(state):
 
         # 8.2.29 skoH saMyogAdyor ante ca
         # TODO: pada end
-        if x in 'sk' and y in Sounds('hal') and z in Sounds('Jal'):
+        if x in 'sk' and y in _HAL and z in _JHAL:
             x = '_'
 
-        if y in Sounds('Jal'):
+        if y in _JHAL:
             # 8.2.30 coH kuH
-            cu = Sounds('cu')
-            if x in cu and y in Sounds('Jal') and y not in cu:
-                x = Sound(x).closest(Sounds('ku'))
+            if x in _CU and y not in _CU:
+                x = Sound(x).closest(_KU)
 
             # 8.2.31 ho DhaH
             elif x == 'h':
                 x = 'Q'
 
             # 8.2.36 vrazca-bhrasja-sRja-mRja-yaja-rAja-bhrAjacCazAM SaH
-            roots = {'vraSc', 'Brasj', 'sfj', 'mfj', 'yaj', 'rAj', 'BrAj'}
-            if c.last and (c.term.value in roots or c.term.antya in 'SC'):
+            if c.last and (c.term.value in VRASCA_BHRASJA
+                           or c.term.antya in 'SC'):
                 x = 'z'
 
         # 8.2.40 (TODO: not dhA)
-        if w in Sounds('Jaz') and x in 'tT':
+        if w in _JHAZ and x in 'tT':
             x = 'D'
         elif x == 'D' and y in 'tT':
             continue
@@ -78,11 +99,11 @@ def asiddha_helper(state):
         #     x = 'M'
 
         # 8.3.24 naz cApadAntasya jhali
-        elif x in 'mn' and y in Sounds('Jal'):
+        elif x in 'mn' and y in _JHAL:
             x = 'M'
 
         # 8.3.59 AdezapratyayayoH
-        if w in Sounds('iN ku'):
+        if w in _IN_KU:
             if not c.last and x == 's' and (c.term.raw[0] == 'z'
                                             or 'pratyaya' in c.term.samjna):
                 x = 'z'
@@ -91,7 +112,7 @@ def asiddha_helper(state):
         # 8.3.79 vibhASeTaH
         # TODO: SIdhvam, luG
         if (x == 'D'
-                and w in Pratyahara('iR', second_R=True)
+                and w in _IR
                 and c.first  # not triggered by iT
                 and 'li~w' in c.term.lakshana):
             x = 'Q'
@@ -105,42 +126,39 @@ def asiddha_helper(state):
         elif x == 'n' and had_rs and p.term.value != 'kzuB':
             x = 'R'
             had_rs = False
-        elif x not in Sounds('aw ku pu'):
+        elif x not in _AW_KU_PU:
             had_rs = False
 
-        stu = Sounds('s tu')
-        if x in stu:
+        if x in _S_TU:
 
             # 8.4.40 stoH zcunA zcuH
             # 8.4.44 zAt (na)
-            scu = Sounds('S cu')
             if w == 'S':
                 pass
-            elif w in scu or y in scu:
-                x = Sound(x).closest(scu)
+            elif w in _S_CU or y in _S_CU:
+                x = Sound(x).closest(_S_CU)
 
             # 8.4.41 STunA STuH
-            zwu = Sounds('z wu')
-            if w in zwu or y in zwu:
-                x = Sound(x).closest(zwu)
+            if w in _Z_WU or y in _Z_WU:
+                x = Sound(x).closest(_Z_WU)
 
-        if x in Sounds('Jal'):
+        if x in _JHAL:
             x_ = x
 
             # 8.4.53 jhalAM jaz jhazi
-            if y in Sounds('JaS'):
-                x = Sound(x_).closest(Sounds('jaS'))
+            if y in _JHAS:
+                x = Sound(x_).closest(_JAS)
 
             # 8.4.54 abhyAse car ca
             if 'abhyasa' in c.term.samjna and c.first:
-                x = Sound(x_).closest(Sounds('car jaS'))
+                x = Sound(x_).closest(_CAR_JAS)
 
             # 8.4.55 khari ca
-            if y in Sounds('Kar'):
-                x = Sound(x_).closest(Sounds('car'))
+            if y in _KHAR:
+                x = Sound(x_).closest(_CAR)
 
         # 8.4.58 anusvArasya yayi parasavarNaH
-        if x == 'M' and y in Sounds('yay'):
+        if x == 'M' and y in _YAY:
             x = Sound(x).closest(Sound(y).savarna_set)
 
         c.value = x if x != '_' else ''
@@ -11,7 +11,7 @@
 
 def memoize(c):
     cache = {}
-    get_key = lambda a, kw: tuple(a) + (frozenset(list(kw.items())),)
+    get_key = lambda a, kw: tuple(a) + (frozenset(kw.items()),)
 
     def memoized(*a, **kw):
         key = get_key(a, kw)
@@ -151,7 +151,15 @@ class Sound(object):
 
             1.1.9  tulyAsyaprayatnaM savarNam
             1.1.10 nAjjhalau
+
+        The result depends only on `self.value`, and sounds are
+        memoized, so it is computed once and stored as a frozenset.
         """
+        try:
+            return self._savarna_set
+        except AttributeError:
+            pass
+
         s = self.value
         a = p = None
 
@@ -167,14 +175,24 @@ class Sound(object):
             p = a
 
         results = a.intersection(p)
-        is_ac = s in Pratyahara('ac')
+        ac = Pratyahara('ac').values
+        is_ac = s in ac
 
         # 1.1.10 na ac-halau
-        return set([x for x in results if (x in Pratyahara('ac')) == is_ac])
+        self._savarna_set = frozenset(x for x in results
+                                      if (x in ac) == is_ac)
+        return self._savarna_set
 
 
 class SoundCollection(object):
 
+    """A group of sounds.
+
+    Collections are memoized and shared, so :attr:`values` is a
+    frozenset. Hot loops can test membership against it directly and
+    skip the call to :meth:`__contains__`.
+    """
+
     def __init__(self, *a, **kw):
         raise NotImplementedError
 
@@ -227,6 +245,7 @@ class Sounds(SoundCollection):
             # Pratyahara
             else:
                 v.update(Pratyahara(item).values)
+        self.values = frozenset(v)
 
 
 @memoize
@@ -279,3 +298,4 @@ class Pratyahara(SoundCollection):
                     second_R = False
                 else:
                     break
+        self.values = frozenset(self.values)
@@ -9,6 +9,7 @@
 """
 
 import re
+import weakref
 from collections import namedtuple
 
 from .sounds import Sounds
@@ -30,13 +31,197 @@ class DataSpace(_DataSpace):
                 new[field] = prev
         return self._replace(**new)
 
+    # Each method below is a fast path for a common call to
+    # :meth:`replace`: it sets one field and every field after it.
+
+    def set_raw(self, raw, clean):
+        return DataSpace(raw, clean, clean, clean, clean)
+
+    def set_value(self, value):
+        return DataSpace(self.raw, self.clean, value, value, value)
+
+    def set_asiddhavat(self, asiddhavat):
+        return DataSpace(self.raw, self.clean, self.value, asiddhavat,
+                         asiddhavat)
+
+    def set_asiddha(self, asiddha):
+        return DataSpace(self.raw, self.clean, self.value, self.asiddhavat,
+                         asiddha)
+
+
+#: Maps each samjna to a distinct bit. Bits are assigned on first use,
+#: so the vocabulary can grow as new terms are defined.
+SAMJNA_BITS = {}
+
+
+def samjna_mask(names):
+    """Return the bitmask that corresponds to a collection of samjna.
+
+    :param names: a collection of samjna
+    """
+    mask = 0
+    for name in names:
+        try:
+            mask |= SAMJNA_BITS[name]
+        except KeyError:
+            bit = SAMJNA_BITS[name] = 1 << len(SAMJNA_BITS)
+            mask |= bit
+    return mask
+
+
+#: Maps a frozenset of samjna to its :func:`samjna_mask`. Terms share a
+#: small number of samjna sets, so each mask is computed only once.
+_MASKS = {}
+
+
+#: Maps a frozenset to the shared instance that :func:`intern_set`
+#: returns for it.
+_SET_POOL = {}
+
+
+def intern_set(values):
+    """Return a shared frozenset equal to `values`.
+
+    Terms use only a few distinct sets of samjna and lakshana, so
+    sharing them saves memory and lets most comparisons between them
+    succeed on identity. Values that are not frozensets are returned
+    unchanged.
+
+    :param values: a frozenset
+    """
+    if type(values) is not frozenset:
+        return values
+    return _SET_POOL.setdefault(values, values)
+
+
+#: Maps the arguments of :func:`_parse_it` to its result. Raw values
+#: come from a small, fixed vocabulary, so each is parsed only once.
+_PARSE_IT_CACHE = {}
+
+_HAL = Sounds('hal').values
+_TU_S_M = Sounds('tu s m').values
+_L_S_KU = Sounds('l S ku').values
+
+#: Deletes the svara marks from a raw value.
+_SVARA_TABLE = str.maketrans('', '', '\\^')
+
+#: Matches a nasalized vowel in a raw value.
+_NASAL_RE = re.compile('.?~')
+
+
+def _parse_it(raw, pratyaya, vibhakti, taddhita):
+    """Split `raw` into its clean value and the samjna its 'it' letters
+    imply.
+
+    :param raw: the raw value, with its 'it' letters
+    :param pratyaya: ``True`` iff the term is a pratyaya
+    :param vibhakti: ``True`` iff the term is a vibhakti
+    :param taddhita: ``True`` iff the term is a taddhita
+    :returns: a ``(clean, samjna)`` pair, where `samjna` is a frozenset
+    """
+    it = set()
+    samjna = set()
+
+    # svara
+    for i, L in enumerate(raw):
+        if L in ('\\', '^'):
+            # anudattet and svaritet
+            if raw[i - 1] == '~':
+                if L == '\\':
+                    samjna.add('anudattet')
+                else:
+                    samjna.add('svaritet')
+            # anudatta and svarita
+            else:
+                if L == '\\':
+                    samjna.add('anudatta')
+                else:
+                    samjna.add('svarita')
+
+    clean = raw.translate(_SVARA_TABLE)
+
+    # The letters in `clean[head:tail]` survive, except for the nasal
+    # vowels removed by 1.3.2.
+    head = 0
+    tail = len(clean)
+
+    # ir
+    if clean.endswith('i~r'):
+        it.add('ir')
+
+    # 1.3.2 "upadeśe 'janunāsika iṭ"
+    for i, L in enumerate(clean):
+        if L == '~':
+            it.add(clean[i - 1] + 'd')
+
+    # 1.3.3. hal antyam
+    antya = clean[-1]
+    if antya in _HAL:
+        # 1.3.4 "na vibhaktau tusmāḥ"
+        if vibhakti and antya in _TU_S_M:
+            pass
+        else:
+            it.add(antya)
+            tail = len(clean) - 1
+
+    # 1.3.5 ādir ñituḍavaḥ
+    try:
+        two_letter = clean[:2]
+        if two_letter in ('Yi', 'wu', 'wv', 'qu'):
+            head = 2
+            if two_letter.endswith('u'):
+                samjna.add(clean[0] + 'vit')
+            else:
+                samjna.add(clean[0] + 'It')
+    except IndexError:
+        pass
+
+    # 1.3.6 "ṣaḥ pratyayasya"
+    # 1.3.7 "cuṭū"
+    #
+    #     It is interesting to note that no examples involving the
+    #     initial ch, jh, Th, and Dh of an affix were provided. This
+    #     omission is significant since affix initials ch, jh, Th,
+    #     and Dh always are replaced by Iy (7.1.2 AyaneyI...) ant
+    #     (7.1.3 jho 'ntaH), ik (7.3.50 ThasyekaH), and ey (7.1.2)
+    #     respectively. Thus the question of treating each of these
+    #     as an it does not arise.
+    #
+    #                         Rama Nath Sharma
+    #                         The Ashtadhyayi of Panini Vol. II
+    #                         Notes on 1.3.7 (p. 145)
+    adi = clean[0]
+    if pratyaya:
+        # no C, J, W, Q by note above.
+        if raw[0] in 'zcjYwqR':
+            it.add(adi)
+            head = max(head, 1)
+
+        # 1.3.8 "laśakv ataddhite"
+        if not taddhita:
+            if adi in _L_S_KU:
+                it.add(adi)
+                head = max(head, 1)
+
+    # 1.3.9 tasya lopaḥ
+    # If `head` already dropped the vowel before a '~', the pattern
+    # removes the '~' by itself.
+    clean = _NASAL_RE.sub('', clean[head:tail])
+    samjna.update(x + 'it' for x in it)
+    return clean, frozenset(samjna)
+
+
+#: Maps a term's class, signature, and ops to a live term with those
+#: properties. See :meth:`Upadesha.copy`.
+_INTERNED = weakref.WeakValueDictionary()
+
 
 class Upadesha(object):
 
     """A term with indicatory letters."""
 
-    __slots__ = ['data', 'samjna', 'lakshana', 'ops', 'parts', '_filter_cache']
-    nasal_re = re.compile('([aAiIuUfFxeEoO])~')
+    __slots__ = ['data', 'samjna', 'lakshana', 'ops', 'parts', '_filter_cache',
+                 '_signature', '_samjna_mask', '_hash', '__weakref__']
 
     def __init__(self, raw=None, **kw):
         # Initialized with new raw value: parse off its 'it' letters.
@@ -57,12 +242,13 @@ class Upadesha(object):
         #: The set of markers that apply to this term. Although the
         #: Ashtadhyayi distinguishes between samjna and *it* tags,
         #: the program merges them together. Thus this set might
-        #: contain both ``'kit'`` and ``'pratyaya'``.
-        self.samjna = kw.pop('samjna', samjna)
+        #: contain both ``'kit'`` and ``'pratyaya'``. Like
+        #: :attr:`lakshana` and :attr:`parts`, this is a frozenset.
+        self.samjna = intern_set(kw.pop('samjna', samjna))
 
         #: The set of values that this term used to have. Technically,
         #: only pratyaya need to have access to this information.
-        self.lakshana = kw.pop('lakshana', frozenset())
+        self.lakshana = intern_set(kw.pop('lakshana', frozenset()))
 
         #: The set of rules that have been applied to this term. This
         #: set is maintained for two reasons. First, it prevents us
@@ -79,6 +265,9 @@ class Upadesha(object):
         self.parts = kw.pop('parts', frozenset())
 
         self._filter_cache = {}
+        self._signature = None
+        self._samjna_mask = None
+        self._hash = None
 
     def __eq__(self, other):
         if self is other:
@@ -99,14 +288,50 @@ class Upadesha(object):
         return "<%s('%s')>" % (self.__class__.__name__, self.value)
 
     def __hash__(self):
-        return hash(self.value)
+        # Subclasses may still adjust `data` in their constructors, so
+        # the hash is computed on first use rather than in `__init__`.
+        if self._hash is None:
+            self._hash = hash(self.data.value)
+        return self._hash
 
     def copy(self, **kw):
-        for x in ['data', 'samjna', 'lakshana', 'ops', 'parts']:
-            if x not in kw:
-                kw[x] = getattr(self, x)
+        """Return a modified copy of this term.
 
-        return self.__class__(**kw)
+        Copies are interned: if an equal term is still alive, that term
+        is returned instead. Since terms are never modified after they
+        are created, equal terms are interchangeable, and sharing them
+        lets derivations reuse each other's filter results.
+        """
+        cls = self.__class__
+        if cls is Upadesha:
+            new = self._fast_copy(kw)
+        else:
+            # Subclass constructors derive samjna from the term's
+            # current state, so they must run on every copy.
+            for x in ['data', 'samjna', 'lakshana', 'ops', 'parts']:
+                if x not in kw:
+                    kw[x] = getattr(self, x)
+            new = cls(**kw)
+        key = (new.__class__, new.signature, frozenset(new.ops))
+        return _INTERNED.setdefault(key, new)
+
+    def _fast_copy(self, kw):
+        """Copy this term without going through :meth:`__init__`.
+
+        :param kw: new values for some of `data`, `samjna`, `lakshana`,
+                   `ops`, and `parts`
+        """
+        new = Upadesha.__new__(Upadesha)
+        new.data = kw.get('data', self.data)
+        new.samjna = intern_set(kw.get('samjna', self.samjna))
+        new.lakshana = intern_set(kw.get('lakshana', self.lakshana))
+        new.ops = kw.get('ops', self.ops)
+        new.parts = kw.get('parts', self.parts)
+        new._filter_cache = {}
+        new._signature = None
+        new._samjna_mask = None
+        new._hash = None
+        return new
 
     @staticmethod
     def as_anga(*a, **kw):
@@ -119,18 +344,18 @@ class Upadesha(object):
         return Upadesha(*a, **kw).add_samjna('anga', 'dhatu')
 
     @property
-    def adi(self, locus='value'):
+    def adi(self):
         """The term's first sound, or ``None`` if there isn't one."""
         try:
-            return getattr(self.data, locus)[0]
+            return self.data.value[0]
         except IndexError:
             return None
 
     @property
-    def antya(self, locus='value'):
+    def antya(self):
         """The term's last sound, or ``None`` if there isn't one."""
         try:
-            return getattr(self.data, locus)[-1]
+            return self.data.value[-1]
         except IndexError:
             return None
 
@@ -155,10 +380,39 @@ class Upadesha(object):
         return self.data.raw
 
     @property
-    def upadha(self, locus='value'):
+    def samjna_mask(self):
+        """The term's samjna as a bitmask. See :func:`samjna_mask`."""
+        if self._samjna_mask is None:
+            samjna = self.samjna
+            try:
+                mask = _MASKS[samjna]
+            except KeyError:
+                mask = _MASKS[samjna] = samjna_mask(samjna)
+            except TypeError:
+                # Not hashable, e.g. a plain set.
+                mask = samjna_mask(samjna)
+            self._samjna_mask = mask
+        return self._samjna_mask
+
+    @property
+    def signature(self):
+        """A hashable summary of everything a filter can inspect.
+
+        Two terms with the same signature are indistinguishable to any
+        filter. Since :attr:`ops` is never inspected by a filter, it is
+        left out, which lets a term and its :meth:`add_op` copies share
+        cached filter results.
+        """
+        if self._signature is None:
+            self._signature = (self.data, self.samjna, self.lakshana,
+                               self.parts)
+        return self._signature
+
+    @property
+    def upadha(self):
         """The term's penultimate sound, or ``None`` if there isn't one."""
         try:
-            return getattr(self.data, locus)[-2]
+            return self.data.value[-2]
         except IndexError:
             return None
 
@@ -168,97 +422,14 @@ class Upadesha(object):
         return self.data.value
 
     def _parse_it(self, raw, **kw):
-        pratyaya = kw.pop('pratyaya', False)
-        vibhakti = kw.pop('vibhakti', False)
-        taddhita = kw.pop('taddhita', False)
-
-        it = set()
-        samjna = set()
-
-        # svara
-        for i, L in enumerate(raw):
-            if L in ('\\', '^'):
-                # anudattet and svaritet
-                if raw[i - 1] == '~':
-                    if L == '\\':
-                        samjna.add('anudattet')
-                    else:
-                        samjna.add('svaritet')
-                # anudatta and svarita
-                else:
-                    if L == '\\':
-                        samjna.add('anudatta')
-                    else:
-                        samjna.add('svarita')
-
-        clean = re.sub('[\\\\^]', '', raw)
-        keep = [True] * len(clean)
-
-        # ir
-        if clean.endswith('i~r'):
-            it.add('ir')
-            keep[-3:] = [True, True, True]
-
-        # 1.3.2 "upadeśe 'janunāsika iṭ"
-        for i, L in enumerate(clean):
-            if L == '~':
-                it.add(clean[i - 1] + 'd')
-                keep[i - 1] = False
-                keep[i] = False
-
-        # 1.3.3. hal antyam
-        antya = clean[-1]
-        if antya in Sounds('hal'):
-            # 1.3.4 "na vibhaktau tusmāḥ"
-            if vibhakti and antya in Sounds('tu s m'):
-                pass
-            else:
-                it.add(antya)
-                keep[-1] = False
-
-        # 1.3.5 ādir ñituḍavaḥ
+        key = (raw, kw.get('pratyaya', False), kw.get('vibhakti', False),
+               kw.get('taddhita', False))
         try:
-            two_letter = clean[:2]
-            if two_letter in ('Yi', 'wu', 'wv', 'qu'):
-                keep[0] = keep[1] = False
-                if two_letter.endswith('u'):
-                    samjna.add(clean[0] + 'vit')
-                else:
-                    samjna.add(clean[0] + 'It')
-        except IndexError:
+            return _PARSE_IT_CACHE[key]
+        except KeyError:
             pass
-
-        # 1.3.6 "ṣaḥ pratyayasya"
-        # 1.3.7 "cuṭū"
-        #
-        #     It is interesting to note that no examples involving the
-        #     initial ch, jh, Th, and Dh of an affix were provided. This
-        #     omission is significant since affix initials ch, jh, Th,
-        #     and Dh always are replaced by Iy (7.1.2 AyaneyI...) ant
-        #     (7.1.3 jho 'ntaH), ik (7.3.50 ThasyekaH), and ey (7.1.2)
-        #     respectively. Thus the question of treating each of these
-        #     as an it does not arise.
-        #
-        #                         Rama Nath Sharma
-        #                         The Ashtadhyayi of Panini Vol. II
-        #                         Notes on 1.3.7 (p. 145)
-        adi = clean[0]
-        if pratyaya:
-            # no C, J, W, Q by note above.
-            if raw[0] in 'zcjYwqR':
-                it.add(adi)
-                keep[0] = False
-
-            # 1.3.8 "laśakv ataddhite"
-            if not taddhita:
-                if adi in Sounds('l S ku'):
-                    it.add(adi)
-                    keep[0] = False
-
-        # 1.3.9 tasya lopaḥ
-        clean = ''.join(L for i, L in enumerate(clean) if keep[i])
-        samjna = samjna.union([x + 'it' for x in it])
-        return clean, samjna
+        returned = _PARSE_IT_CACHE[key] = _parse_it(*key)
+        return returned
 
     def add_lakshana(self, *names):
         """
@@ -272,7 +443,12 @@ class Upadesha(object):
 
         :param names: the ops to add
         """
-        return self.copy(ops=self.ops.union(names))
+        new = self.copy(ops=self.ops.union(names))
+        # Filters never inspect `ops`, so a fresh copy can share our
+        # cached filter results.
+        if not new._filter_cache:
+            new._filter_cache = self._filter_cache
+        return new
 
     def add_part(self, *names):
         """
@@ -293,7 +469,7 @@ class Upadesha(object):
 
         :param names:
         """
-        return any(a in self.samjna for a in names)
+        return not self.samjna.isdisjoint(names)
 
     def get_at(self, locus):
         """
@@ -314,14 +490,14 @@ class Upadesha(object):
 
         :param asiddha: the new asiddha value
         """
-        return self.copy(data=self.data.replace(asiddha=asiddha))
+        return self.copy(data=self.data.set_asiddha(asiddha))
 
     def set_asiddhavat(self, asiddhavat):
         """
 
         :param asiddhavat: the new asiddhavat value
         """
-        return self.copy(data=self.data.replace(asiddhavat=asiddhavat))
+        return self.copy(data=self.data.set_asiddhavat(asiddhavat))
 
     def set_at(self, locus, value):
         """
@@ -348,9 +524,9 @@ class Upadesha(object):
         clean, it_samjna = self._parse_it(raw)
         samjna = self.samjna | it_samjna
         return self.copy(
-            data=self.data.replace(raw=raw, clean=clean),
+            data=self.data.set_raw(raw, clean),
             samjna=samjna,
-            lakshana=self.lakshana | set([self.raw])
+            lakshana=self.lakshana | frozenset([self.raw])
         )
 
     def set_value(self, value):
@@ -358,7 +534,15 @@ class Upadesha(object):
 
         :param value: the new value
         """
-        return self.copy(data=self.data.replace(value=value))
+        return self.copy(data=self.data.set_value(value))
+
+
+# Samjna that the constructors below add to every new term.
+_PRATYAYA = frozenset(['pratyaya'])
+_KRT = frozenset(['krt'])
+_SARVADHATUKA = frozenset(['sarvadhatuka'])
+_ARDHADHATUKA = frozenset(['ardhadhatuka'])
+_VIBHAKTI = frozenset(['vibhakti'])
 
 
 class Pratyaya(Upadesha):
@@ -367,11 +551,11 @@ class Pratyaya(Upadesha):
 
     def __init__(self, *a, **kw):
         Upadesha.__init__(self, *a, **kw)
-        self.samjna |= set(['pratyaya'])
+        self.samjna = intern_set(self.samjna | _PRATYAYA)
 
         # 1.1.__ pratyayasya lukzlulupaH
         if self.value in ('lu~k', 'Slu~', 'lu~p'):
-            self.data = self.data.replace(raw=self.value, clean='')
+            self.data = self.data.set_raw(self.value, '')
 
     def _parse_it(self, value):
         return Upadesha._parse_it(self, value, pratyaya=True)
@@ -383,14 +567,15 @@ class Krt(Pratyaya):
 
     def __init__(self, *a, **kw):
         Pratyaya.__init__(self, *a, **kw)
-        self.samjna |= set(['krt'])
+        samjna = self.samjna | _KRT
 
         # 3.4.113 tiGzit sArvadhAtukam
         # 3.4.115 liT ca (ArdhadhAtukam)
-        if 'Sit' in self.samjna and self.raw != 'li~w':
-            self.samjna |= set(['sarvadhatuka'])
+        if 'Sit' in samjna and self.raw != 'li~w':
+            samjna |= _SARVADHATUKA
         else:
-            self.samjna |= set(['ardhadhatuka'])
+            samjna |= _ARDHADHATUKA
+        self.samjna = intern_set(samjna)
 
 
 class Vibhakti(Pratyaya):
@@ -399,7 +584,7 @@ class Vibhakti(Pratyaya):
 
     def __init__(self, *a, **kw):
         Pratyaya.__init__(self, *a, **kw)
-        self.samjna |= set(['vibhakti'])
+        self.samjna = intern_set(self.samjna | _VIBHAKTI)
 
     def _parse_it(self, value):
         return Upadesha._parse_it(self, value, pratyaya=True, vibhakti=True)
@@ -9,9 +9,39 @@
 """
 
 import itertools
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
 
+from . import filters as F
 from .templates import *
+from .terms import samjna_mask
+
+#: The maximum number of (state, index) selections that a
+#: :class:`RuleTree` remembers.
+SELECT_CACHE_SIZE = 50000
+
+#: The samjna mask that a :class:`~vyakarana.filters.dhatu` filter
+#: requires, in addition to a matching raw value.
+DHATU_MASK = samjna_mask(['dhatu'])
+
+#: Maps a filter class to its priority in :func:`feature_priority`.
+FEATURE_PRIORITY = {
+    F.raw: 0,
+    F.dhatu: 0,
+    F.samjna: 1,
+}
+
+
+def feature_priority(feature):
+    """Return the priority of a feature when building a tree.
+
+    Features with lower priority are used first. `raw` and `dhatu`
+    features match few terms and are looked up by value during
+    selection, so they come first. `samjna` features are a bitmask
+    test, and all other features need a full filter call.
+
+    :param feature: a ``(filter, offset)`` pair
+    """
+    return FEATURE_PRIORITY.get(type(feature[0]), 2)
 
 
 def find_apavada_rules(rules):
@@ -56,28 +86,36 @@ class RuleTree(object):
     comparisons we have to make. Rule selection becomes roughly log(RT).
     """
 
-    def __init__(self, rules, ranker=None, used_features=None):
+    def __init__(self, rules, ranker=None, used_features=None,
+                 rule_features=None):
         # HACK
         if ranker is not None:
             self.ranked_rules = sorted(rules, key=ranker, reverse=True)
+            #: Maps a rule to its position in `self.ranked_rules`.
+            self.rank_index = {r: i for i, r in enumerate(self.ranked_rules)}
             apavadas = find_apavada_rules(rules)
             for rule, values in apavadas.items():
                 rule.apavada = values
                 for a in values:
                     a.utsarga.append(rule)
 
-        #: A list of rules that could not be subdivided any further.
+        #: A tuple of rules that could not be subdivided any further.
         #: This is usually because the rule is unspecified in some way.
         self.rules = []
         #: Maps from features to :class:`RuleTree` subtrees.
         self.features = {}
         used_features = used_features or frozenset()
 
+        # Maps a rule to its features. This is computed once for the
+        # root and shared with every subtree.
+        if rule_features is None:
+            rule_features = {r: tuple(r.features()) for r in rules}
+
         # Maps a feature tuple to a list of rules
         feature_map = defaultdict(list)
         for rule in rules:
             appended = False
-            for feat in rule.features():
+            for feat in rule_features[rule]:
                 if feat not in used_features:
                     feature_map[feat].append(rule)
                     appended = True
@@ -86,8 +124,10 @@ class RuleTree(object):
             if not appended:
                 self.rules.append(rule)
 
-        # Sort from most general to most specific.
-        buckets = sorted(iter(feature_map.items()), key=lambda p: -len(p[1]))
+        # File rules under their most selective kind of feature first,
+        # then sort from most general to most specific.
+        buckets = sorted(feature_map.items(),
+                         key=lambda p: (feature_priority(p[0]), -len(p[1])))
 
         seen = set()
         for feat, rule_list in buckets:
@@ -95,27 +135,69 @@ class RuleTree(object):
             if not unseen:
                 continue
             subtree = RuleTree(rules=unseen,
-                               used_features=used_features | set([feat]))
+                               used_features=used_features | set([feat]),
+                               rule_features=rule_features)
             self.features[feat] = subtree
             seen.update(rule_list)
 
+        self.rules = tuple(self.rules)
+        self._index_features()
+
+    def _index_features(self):
+        """Build the views of `self.features` that :meth:`_select` uses.
+
+        :meth:`select` is called for every index of every state, so
+        features are prepared for cheap tests:
+
+        - `raw` and `dhatu` features are indexed by offset and raw
+          value. Instead of testing each one, :meth:`_select` looks
+          up the raw value of the term at each offset and visits only
+          the subtrees filed under it. A `dhatu` feature also requires
+          the term to have the ``'dhatu'`` samjna.
+        - `samjna` features carry their bitmask for an inline test.
+        - All other features are tested with :meth:`Filter.allows`.
+        """
+        self._rule_set = frozenset(self.rules)
+
+        feature_list = []
+        raw_index = defaultdict(lambda: defaultdict(list))
+        for (filt, i), tree in self.features.items():
+            cls = type(filt)
+            if cls is F.raw or cls is F.dhatu:
+                mask = DHATU_MASK if cls is F.dhatu else None
+                for raw in filt.domain:
+                    raw_index[i][raw].append((tree, mask))
+            elif cls is F.samjna:
+                feature_list.append((filt, i, tree, filt.mask))
+            else:
+                feature_list.append((filt, i, tree, None))
+
+        self._feature_list = tuple(feature_list)
+        self._raw_index = tuple(
+            (i, dict((raw, tuple(v)) for raw, v in by_raw.items()))
+            for i, by_raw in raw_index.items())
+
     def __len__(self):
         """The number of rules in the tree."""
         self_len = len(self.rules)
-        return self_len + sum(len(v) for k, v in self.features.items())
+        return self_len + sum(len(v) for v in self.features.values())
 
     def candidates(self, state):
         """Generate all rule-index pairs that could apply to the state.
 
         :param state: the current state
         """
-        state_indices = list(range(len(state)))
-        candidates = [self.select(state, i) for i in state_indices]
+        rank_index = self.rank_index
+        select = self.select
+        pairs = []
+        for ia in range(len(state)):
+            pairs.extend((rank_index[ra], ia, ra) for ra in select(state, ia))
 
-        for i, ra in enumerate(self.ranked_rules):
-            for ia in state_indices:
-                if ra in candidates[ia]:
-                    yield ra, ia
+        # Most rules are never selected, so sorting the selected pairs
+        # is much cheaper than scanning every ranked rule.
+        pairs.sort(key=lambda p: (p[0], p[1]))
+        for _, ia, ra in pairs:
+            yield ra, ia
 
     def pprint(self, depth=0):
         """Pretty-print the tree."""
@@ -129,15 +211,68 @@ class RuleTree(object):
     def select(self, state, index):
         """Return a set of rules that might be applicable.
 
+        The derivation loop visits many states whose terms differ only
+        in the rules applied to them, so results are cached by the
+        signatures of the state's terms.
+
         :param state: the current :class:`State`
         :param index: the current index
         """
-        selection = set(self.rules)
+        # Maps a (state signature, index) pair to the result of this
+        # method. Least recently used entries are dropped once the
+        # cache holds `SELECT_CACHE_SIZE` entries. Subtrees are walked
+        # through `_select`, so only the tree that is queried directly
+        # allocates one.
+        try:
+            cache = self._select_cache
+        except AttributeError:
+            cache = self._select_cache = OrderedDict()
+        key = (tuple(t.signature for t in state), index)
+        try:
+            selection = cache.pop(key)
+        except KeyError:
+            selection = set()
+            masks = tuple(t.samjna_mask for t in state)
+            raws = tuple(t.raw for t in state)
+            self._select(state, index, selection, masks, raws)
+            selection = frozenset(selection)
+            if len(cache) >= SELECT_CACHE_SIZE:
+                cache.popitem(last=False)
+        cache[key] = selection
+        return selection
 
-        for feature, tree in self.features.items():
-            filt, i = feature
+    def _select(self, state, index, selection, masks, raws):
+        """Walk the tree and collect the rules that might apply.
+
+        :param state: the current :class:`State`
+        :param index: the current index
+        :param selection: the set that collects rules. It is shared by
+                          the entire walk.
+        :param masks: the samjna mask of each term in `state`, read once
+                      before the walk.
+        :param raws: the raw value of each term in `state`, read once
+                     before the walk.
+        """
+        selection.update(self._rule_set)
+
+        for i, by_raw in self._raw_index:
             j = index + i
-            if j >= 0 and filt.allows(state, j):
-                selection.update(tree.select(state, index))
+            if j < 0 or j >= len(raws):
+                continue
+            for tree, mask in by_raw.get(raws[j], ()):
+                if mask is None or masks[j] & mask:
+                    tree._select(state, index, selection, masks, raws)
 
-        return selection
+        for filt, i, tree, mask in self._feature_list:
+            j = index + i
+            if j < 0:
+                continue
+            if mask is None:
+                ok = filt.allows(state, j)
+            else:
+                try:
+                    ok = masks[j] & mask
+                except IndexError:
+                    ok = False
+            if ok:
+                tree._select(state, index, selection, masks, raws)
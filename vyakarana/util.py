@@ -12,15 +12,27 @@ import itertools
 
 
 def iter_group(items, n):
-    """Iterate over `items` by taking `n` items at a time."""
-    for i in range(0, len(items), n):
-        yield items[i:i + n]
+    """Iterate over `items` by taking `n` items at a time.
+
+    Sequences are sliced directly. Other iterables are consumed lazily
+    and grouped into lists.
+    """
+    if hasattr(items, '__getitem__'):
+        for i in range(0, len(items), n):
+            yield items[i:i + n]
+        return
+
+    items = iter(items)
+    group = list(itertools.islice(items, n))
+    while group:
+        yield group
+        group = list(itertools.islice(items, n))
 
 
 def iter_pairwise(items):
-    x, y = itertools.tee(items)
-    next(y, None)
-    return zip(x, y)
+    """Iterate over each pair of adjacent items in `items`."""
+    items = list(items)
+    return zip(items, items[1:])
 
 
 class SoundEditor(object):
@@ -28,51 +40,85 @@ class SoundEditor(object):
     def __init__(self, state, locus='asiddha'):
         self.state = state
         self.locus = locus
-        self.data = [list(term.asiddha) for term in state]
 
-        self.indices = []
-        abs_index = 0
+        #: Every sound in the state, in order. Edits are written here,
+        #: so this always holds the current value of each sound.
+        self.letters = []
+        #: The position in `letters` where each term starts.
+        self.term_starts = []
+
+        #: For each sound in `letters`, the index of its term.
+        self.state_indices = []
         for i, term in enumerate(state):
-            for j, sound in enumerate(term.asiddha):
-                sound_index = SoundIndex(value=sound, term=term, state_index=i,
-                                         term_index=j, absolute_index=abs_index, editor=self)
-                self.indices.append(sound_index)
-                abs_index += 1
+            self.term_starts.append(len(self.letters))
+            self.letters.extend(term.asiddha)
+            self.state_indices.extend([i] * len(term.asiddha))
+
+        #: The :class:`SoundIndex` for each sound. Each is created on
+        #: first use and shared after that.
+        self.indices = [None] * len(self.letters)
+        #: Stands in for sounds past either end of the state.
+        self.sentinel = SoundIndex(editor=self)
 
     def __iter__(self):
-        for index in self.indices:
-            yield index
+        for i in range(len(self.letters)):
+            yield self._index(i)
+
+    def _index(self, abs_index):
+        """Return the :class:`SoundIndex` at `abs_index`.
+
+        :param abs_index: an absolute index into `letters`
+        """
+        index = self.indices[abs_index]
+        if index is None:
+            i = self.state_indices[abs_index]
+            index = self.indices[abs_index] = SoundIndex(
+                value=self.letters[abs_index], term=self.state[i],
+                state_index=i, term_index=abs_index - self.term_starts[i],
+                absolute_index=abs_index, editor=self)
+        return index
 
     def join(self):
         state = self.state
+        letters = self.letters
+        ends = self.term_starts[1:] + [len(letters)]
+        # 'asiddha' is the last field of a term's data space, so setting
+        # it to its current value changes nothing. Other loci also
+        # overwrite the fields after them.
+        keep_same = self.locus == 'asiddha'
         new_terms = []
-        for i, term in enumerate(state):
-            new_value = ''.join(L for L in self.data[i])
-            new_term = self.state[i].set_at(self.locus, new_value)
-            new_terms.append(new_term)
+        for term, start, end in zip(state, self.term_starts, ends):
+            new_value = ''.join(letters[start:end])
+            if keep_same and new_value == term.asiddha:
+                new_terms.append(term)
+            else:
+                new_terms.append(term.set_at(self.locus, new_value))
 
         return state.replace_all(new_terms)
 
     def next(self, index):
         try:
-            return self.indices[index.absolute_index + 1]
-        except (TypeError, IndexError):
-            return SoundIndex(editor=self)
+            new_index = index.absolute_index + 1
+        except TypeError:
+            return self.sentinel
+        if new_index < len(self.letters):
+            return self._index(new_index)
+        return self.sentinel
 
     def prev(self, index):
         try:
             new_index = index.absolute_index - 1
-            if new_index >= 0:
-                return self.indices[new_index]
         except TypeError:
-            pass
-        return SoundIndex(editor=self)
+            return self.sentinel
+        if new_index >= 0:
+            return self._index(new_index)
+        return self.sentinel
 
 
 class SoundIndex(object):
 
     __slots__ = ['_value', 'term', 'state_index', 'term_index',
-                 'absolute_index', 'editor', 'first', 'last']
+                 'absolute_index', 'editor']
 
     def __init__(self, value=None, term=None, state_index=None,
                  term_index=None, absolute_index=None, editor=None):
@@ -89,10 +135,16 @@ class SoundIndex(object):
         #: The sound iterator that produced this index
         self.editor = editor
 
-        #: True iff this is the first letter in the term.
-        self.first = term_index == 0
-        #: True iff this is the last letter in the term.
-        self.last = term_index == len(term.value) - 1 if term else False
+    @property
+    def first(self):
+        """True iff this is the first letter in the term."""
+        return self.term_index == 0
+
+    @property
+    def last(self):
+        """True iff this is the last letter in the term."""
+        term = self.term
+        return term is not None and self.term_index == len(term.value) - 1
 
     @property
     def next(self):
@@ -109,4 +161,4 @@ class SoundIndex(object):
     @value.setter
     def value(self, new_value):
         self._value = new_value
-        self.editor.data[self.state_index][self.term_index] = new_value
+        self.editor.letters[self.absolute_index] = new_value